@@ -60,7 +60,11 @@ class GitPDMWorkbench(FreeCADGui.Workbench):
         """
         Called when the workbench is first activated
         """
-        from freecad_gitpdm import commands
+        from freecad_gitpdm import commands, workbench
+
+        # Kept on the instance for Activated(), which FreeCAD only ever calls
+        # after Initialize() -- saves re-running the import on every switch.
+        self._workbench = workbench
 
         # Toolbar: just the two genuinely one-click, frequent desktop
         # actions. Everything else lives only in the "Git PDM" menu below --
@@ -90,34 +94,11 @@ class GitPDMWorkbench(FreeCADGui.Workbench):
         """
         Called when the workbench is activated (switched to)
         """
-        from freecad_gitpdm.core import log
-
-        log.info("GitPDM workbench activated")
-
-        # Auto-show panel when workbench is activated. Goes through
-        # FreeCAD's own "PySide" compatibility shim (re-exports whichever
-        # binding -- PySide2/PySide6/... -- the running FreeCAD was built
-        # against) rather than a hardcoded PySide6/PySide2 fallback chain,
-        # so this doesn't need updating on the next Qt major-version bump.
-        from PySide import QtCore
-
-        # Defer panel opening to avoid blocking UI
-        QtCore.QTimer.singleShot(100, self._open_panel_deferred)
-
-    def _open_panel_deferred(self):
-        """Open panel after brief delay to keep UI responsive."""
-        try:
-            from freecad_gitpdm import commands
-
-            # Left-docked, tabbed with Report view/Python console when
-            # present (same fallback shape as commands._find_or_create_dock,
-            # reused here so the two entry points never disagree on layout).
-            dock = commands._find_or_create_dock()
-            commands._show_dock(dock)
-        except Exception as e:
-            from freecad_gitpdm.core import log
-
-            log.error(f"Failed to auto-open panel: {e}")
+        # Auto-show panel when workbench is activated. The logic lives in
+        # freecad_gitpdm/workbench.py, a normally-imported module whose
+        # Qt/log/commands bindings are resolved once at module scope --
+        # module-level state in this exec'd file isn't reliable (see Icon).
+        self._workbench.on_activated()
 
     def Deactivated(self):
         """
@@ -138,5 +119,8 @@ class GitPDMWorkbench(FreeCADGui.Workbench):
         return "Gui::PythonWorkbench"
 
 
-# Register the workbench with FreeCAD
-FreeCADGui.addWorkbench(GitPDMWorkbench())
+# Register the workbench with FreeCAD. Guarded so a second exec of this file
+# (e.g. a stale extra copy of the addon under another Mod/ folder) doesn't
+# build and register a duplicate workbench instance.
+if "GitPDMWorkbench" not in FreeCADGui.listWorkbenches():
+    FreeCADGui.addWorkbench(GitPDMWorkbench())
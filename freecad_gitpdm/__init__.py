@@ -5,11 +5,25 @@ GitPDM package root
 Sprint 1: Package initialization
 """
 
+import importlib
+
 __version__ = "0.6.4"
 __title__ = "GitPDM"
 
-# Import core modules to ensure they're available
-from . import core
+# Submodules are loaded on first attribute access (PEP 562) rather than at
+# package import, so FreeCAD doesn't pay for core/ui until the workbench is
+# actually used. `from freecad_gitpdm import x` already imports on demand;
+# this keeps plain `freecad_gitpdm.core` attribute access working too.
+_LAZY_SUBMODULES = ("core", "commands", "workbench")
 
-# UI is imported only when needed (lazy load for FreeCAD compatibility)
 __all__ = ["core"]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -29,8 +29,6 @@ def credential_target_name(host="github.com", account=None):
         >>> credential_target_name(host="github.enterprise.com")
         'GitPDM:github.enterprise.com:oauth'
     """
-    parts = ["GitPDM", host]
     if account:
-        parts.append(account)
-    parts.append("oauth")
-    return ":".join(parts)
+        return f"GitPDM:{host}:{account}:oauth"
+    return f"GitPDM:{host}:oauth"
@@ -10,6 +10,11 @@ from __future__ import annotations
 import sys
 from freecad_gitpdm.auth.token_store import TokenStore
 
+# Process-wide store from create_token_store(). Constructing a platform
+# store probes the OS keyring backend (and, with the file fallback enabled,
+# does a test load), which every sign-in/auth lookup would otherwise repeat.
+_store: TokenStore | None = None
+
 
 def _store_usable(store: TokenStore) -> bool:
     """
@@ -32,7 +37,7 @@ def _store_usable(store: TokenStore) -> bool:
 
 def create_token_store() -> TokenStore:
     """
-    Create the appropriate token store for the current platform.
+    Return the token store for the current platform, creating it once.
 
     When GITPDM_ALLOW_FILE_TOKENS=1 is set and the platform's OS
     credential store is unavailable, falls back to the file-based store
@@ -45,7 +50,21 @@ def create_token_store() -> TokenStore:
 
     Raises:
         OSError: If no token store is available for the current platform
+            (not cached, so a later call tries again)
     """
+    global _store
+    if _store is None:
+        _store = _create_token_store()
+    return _store
+
+
+def _reset_token_store() -> None:
+    """Forget the process-wide token store (tests)."""
+    global _store
+    _store = None
+
+
+def _create_token_store() -> TokenStore:
     from freecad_gitpdm.auth.token_store_file import (
         FileTokenStore,
         file_tokens_allowed,
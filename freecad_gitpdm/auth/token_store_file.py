@@ -67,8 +67,8 @@ class FileTokenStore(TokenStore):
 
     def _read_all(self) -> dict:
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self._path, "rb") as f:
+                data = json.loads(f.read())
         except FileNotFoundError:
             return {}
         except json.JSONDecodeError as e:
@@ -84,8 +84,8 @@ class FileTokenStore(TokenStore):
         except OSError:
             pass  # best effort on platforms without POSIX modes
         tmp_path = self._path.with_suffix(".json.tmp")
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(data, indent=2).encode("utf-8"))
         try:
             os.chmod(tmp_path, 0o600)
         except OSError:
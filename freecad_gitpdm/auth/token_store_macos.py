@@ -11,9 +11,37 @@ which provides a Pythonic interface to the macOS Keychain.
 from __future__ import annotations
 
 import json
+import threading
 from freecad_gitpdm.auth.token_store import TokenStore
 from freecad_gitpdm.auth.oauth_device_flow import TokenResponse
 from freecad_gitpdm.auth.keys import credential_target_name
+from freecad_gitpdm.core import log
+
+# (host, account) -> TokenResponse from a successful load(). Each Keychain
+# read goes through `security`/XPC (tens of ms) and the stored blob only
+# changes through save()/delete(), which drop the host's entries. Shared
+# across instances so tests (and any store built outside the factory)
+# see one view.
+_token_cache: dict = {}
+# (host, account) keys whose load() found nothing under either the account
+# key or the host-only fallback -- the usual state before first sign-in,
+# which would otherwise cost two Keychain reads per auth lookup.
+_known_missing: set = set()
+_token_cache_lock = threading.Lock()
+
+
+def _forget_host(host: str) -> None:
+    with _token_cache_lock:
+        for key in [k for k in _token_cache if k[0] == host]:
+            del _token_cache[key]
+        _known_missing.difference_update([k for k in _known_missing if k[0] == host])
+
+
+def _remember_missing(host: str, account: str | None) -> None:
+    with _token_cache_lock:
+        _known_missing.add((host, account))
+        # Both lookups missed, so the host-only key is absent too.
+        _known_missing.add((host, None))
 
 
 class MacOSKeychainStore(TokenStore):
@@ -40,8 +68,6 @@ class MacOSKeychainStore(TokenStore):
 
             # Verify we have a real keychain backend (not the fail keyring)
             if "fail" in backend_name.lower() or "null" in backend_name.lower():
-                from freecad_gitpdm.core import log
-
                 log.warning(
                     f"Keyring backend is not functional: {backend_name}. "
                     "Keychain access not available."
@@ -49,10 +75,9 @@ class MacOSKeychainStore(TokenStore):
                 self._available = False
             else:
                 self._keyring = keyring
+                self._delete_error = keyring.errors.PasswordDeleteError
                 self._available = True
         except Exception as e:
-            from freecad_gitpdm.core import log
-
             log.warning(f"macOS Keychain not available: {e}")
             self._available = False
 
@@ -69,13 +94,9 @@ class MacOSKeychainStore(TokenStore):
             OSError: If keychain storage operation fails
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.error("macOS Keychain not available")
             raise OSError("macOS Keychain not available on this system")
 
-        from freecad_gitpdm.core import log
-
         target_name = credential_target_name(host, account)
 
         # Serialize token to JSON
@@ -92,6 +113,11 @@ class MacOSKeychainStore(TokenStore):
             log.error(f"Failed to store token in Keychain: {e}")
             raise OSError(f"Failed to store token in macOS Keychain: {e}")
 
+        # A host-only save can change what load(host, account) falls back to.
+        _forget_host(host)
+        with _token_cache_lock:
+            _token_cache[(host, account)] = token
+
     def load(self, host: str, account: str | None) -> TokenResponse | None:
         """
         Load token from macOS Keychain.
@@ -108,12 +134,16 @@ class MacOSKeychainStore(TokenStore):
             ValueError: If stored data is invalid
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.debug("macOS Keychain not available")
             return None
 
-        from freecad_gitpdm.core import log
+        with _token_cache_lock:
+            cached = _token_cache.get((host, account))
+            missing = (host, account) in _known_missing
+        if cached is not None:
+            return cached
+        if missing:
+            return None
 
         target_name = credential_target_name(host, account)
 
@@ -133,11 +163,8 @@ class MacOSKeychainStore(TokenStore):
                         token_json = self._keyring.get_password(
                             self._service_name, fallback_target
                         )
-                        if token_json is None:
-                            return None
-                    else:
-                        return None
-                else:
+                if token_json is None:
+                    _remember_missing(host, account)
                     return None
 
             # Parse the token JSON
@@ -145,7 +172,10 @@ class MacOSKeychainStore(TokenStore):
 
             log.debug(f"Token loaded successfully for {target_name}")
 
-            return TokenResponse.from_dict(token_data)
+            token = TokenResponse.from_dict(token_data)
+            with _token_cache_lock:
+                _token_cache[(host, account)] = token
+            return token
 
         except json.JSONDecodeError as e:
             log.error(f"Failed to parse stored token: {e}")
@@ -166,35 +196,40 @@ class MacOSKeychainStore(TokenStore):
             OSError: If keychain deletion fails
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.error("macOS Keychain not available")
             raise OSError("macOS Keychain not available on this system")
 
-        from freecad_gitpdm.core import log
-
         target_name = credential_target_name(host, account)
+        _forget_host(host)
 
         log.debug(f"Deleting token for {target_name} from macOS Keychain")
 
         try:
-            # Try to delete the primary token
-            self._keyring.delete_password(self._service_name, target_name)
-            log.debug(f"Token deleted successfully for {target_name}")
-        except self._keyring.errors.PasswordDeleteError:
-            # Token not found - this is not an error
-            log.debug(f"Token not found for {target_name}")
-        except Exception as e:
-            log.error(f"Failed to delete token from Keychain: {e}")
-            raise OSError(f"Failed to delete token from macOS Keychain: {e}")
-
-        # Also try to delete fallback (host-only) key if account was provided
-        if account:
-            fallback_target = credential_target_name(host, None)
-            if fallback_target != target_name:
-                try:
-                    self._keyring.delete_password(self._service_name, fallback_target)
-                    log.debug(f"Fallback token deleted for {fallback_target}")
-                except Exception:
-                    # Fallback key might not exist - ignore
-                    pass
+            try:
+                # Try to delete the primary token
+                self._keyring.delete_password(self._service_name, target_name)
+                log.debug(f"Token deleted successfully for {target_name}")
+            except self._delete_error:
+                # Token not found - this is not an error
+                log.debug(f"Token not found for {target_name}")
+            except Exception as e:
+                log.error(f"Failed to delete token from Keychain: {e}")
+                raise OSError(f"Failed to delete token from macOS Keychain: {e}")
+
+            # Also try to delete fallback (host-only) key if account was provided
+            if account:
+                fallback_target = credential_target_name(host, None)
+                if fallback_target != target_name:
+                    try:
+                        self._keyring.delete_password(
+                            self._service_name, fallback_target
+                        )
+                        log.debug(f"Fallback token deleted for {fallback_target}")
+                    except Exception:
+                        # Fallback key might not exist - ignore
+                        pass
+        finally:
+            # Again afterwards: a load() on another thread between the
+            # forget above and these deletes can re-cache the token being
+            # deleted, which would then outlive sign-out.
+            _forget_host(host)
@@ -16,6 +16,7 @@ from ctypes import wintypes
 from freecad_gitpdm.auth.token_store import TokenStore
 from freecad_gitpdm.auth.oauth_device_flow import TokenResponse
 from freecad_gitpdm.auth.keys import credential_target_name
+from freecad_gitpdm.core import log
 
 
 # Windows Credential Manager constants
@@ -48,14 +49,34 @@ CREDENTIAL._fields_ = [
 ]
 
 
+# (CredWriteW, CredReadW, CredDeleteW, CredFree), bound once per process:
+# the prototypes never change, so later stores reuse the same pointers
+# instead of re-declaring argtypes/restype on every construction.
+_cred_functions = None
+
+
 def _get_cred_functions():
     """
     Get Windows credential manager functions from advapi32.dll
 
     Returns:
         tuple: (CredWriteW, CredReadW, CredDeleteW, CredFree)
+
+    Raises:
+        AttributeError, OSError: If advapi32 isn't available (not cached,
+            so a later call tries again)
     """
-    advapi32 = ctypes.windll.advapi32
+    global _cred_functions
+    if _cred_functions is None:
+        _cred_functions = _bind_cred_functions()
+    return _cred_functions
+
+
+def _bind_cred_functions():
+    # use_last_error=True makes ctypes snapshot GetLastError() right after
+    # each call, which is what ctypes.get_last_error() reads. Functions from
+    # ctypes.windll never update that copy, so it always read back as 0.
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
 
     # CredWriteW: BOOL CredWriteW(PCREDENTIALW Credential, DWORD Flags);
     CredWriteW = advapi32.CredWriteW
@@ -104,8 +125,6 @@ class WindowsCredentialStore(TokenStore):
             self._available = True
         except (AttributeError, OSError) as e:
             # Windows API not available (e.g., on non-Windows)
-            from freecad_gitpdm.core import log
-
             log.warning(f"Windows Credential Manager not available: {e}")
             self._available = False
 
@@ -122,13 +141,9 @@ class WindowsCredentialStore(TokenStore):
             OSError: If credential storage fails
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.error("Windows Credential Manager not available")
             raise OSError("Windows Credential Manager not available")
 
-        from freecad_gitpdm.core import log
-
         target_name = credential_target_name(host, account)
 
         # Serialize token to JSON
@@ -140,10 +155,12 @@ class WindowsCredentialStore(TokenStore):
         cred.Type = CRED_TYPE_GENERIC
         cred.TargetName = ctypes.c_wchar_p(target_name)
         cred.Comment = ctypes.c_wchar_p("")
+        # A plain byte array rather than c_char_p, which is NUL-terminated
+        # string semantics for what is really a sized blob. `blob` stays
+        # referenced until CredWriteW has returned.
+        blob = (ctypes.c_ubyte * len(token_bytes)).from_buffer_copy(token_bytes)
         cred.CredentialBlobSize = len(token_bytes)
-        cred.CredentialBlob = ctypes.cast(
-            ctypes.c_char_p(token_bytes), ctypes.POINTER(wintypes.BYTE)
-        )
+        cred.CredentialBlob = ctypes.cast(blob, ctypes.POINTER(wintypes.BYTE))
         cred.Persist = CRED_PERSIST_LOCAL_MACHINE
         cred.AttributeCount = 0
         cred.Attributes = None
@@ -152,9 +169,6 @@ class WindowsCredentialStore(TokenStore):
         # Write credential
         log.debug(f"Storing token for {target_name} in Windows Credential Manager")
 
-        # Clear any previous error state
-        ctypes.set_last_error(0)
-
         result = self._cred_write(ctypes.byref(cred), 0)
 
         if not result:
@@ -180,13 +194,9 @@ class WindowsCredentialStore(TokenStore):
             ValueError: If stored data is invalid
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.debug("Windows Credential Manager not available")
             return None
 
-        from freecad_gitpdm.core import log
-
         def _read_target(target_name: str) -> TokenResponse | None:
             """Read a token from a specific Windows Credential Manager target."""
             pCred = ctypes.POINTER(CREDENTIAL)()
@@ -194,9 +204,6 @@ class WindowsCredentialStore(TokenStore):
                 f"Loading token for {target_name} from Windows Credential Manager"
             )
 
-            # Clear any previous error state
-            ctypes.set_last_error(0)
-
             result = self._cred_read(
                 ctypes.c_wchar_p(target_name),
                 CRED_TYPE_GENERIC,
@@ -206,8 +213,8 @@ class WindowsCredentialStore(TokenStore):
 
             if not result:
                 error_code = ctypes.get_last_error()
-                # ERROR_NOT_FOUND = 1168, but also treat 0 as "not found"
-                # (Windows sometimes returns 0 instead of 1168)
+                # ERROR_NOT_FOUND = 1168; also treat 0 (no error recorded)
+                # as "not found"
                 if error_code == 1168 or error_code == 0:
                     log.debug(
                         f"Token not found for {target_name} (error code: {error_code})"
@@ -217,10 +224,10 @@ class WindowsCredentialStore(TokenStore):
                 raise OSError(f"CredReadW failed: {error_code}")
 
             try:
-                # Extract credential blob
+                # Extract credential blob (one memcpy, not a per-byte loop)
                 cred = pCred.contents
-                token_bytes = bytes(
-                    cred.CredentialBlob[i] for i in range(cred.CredentialBlobSize)
+                token_bytes = ctypes.string_at(
+                    cred.CredentialBlob, cred.CredentialBlobSize
                 )
                 token_json = token_bytes.decode("utf-8")
                 token_data = json.loads(token_json)
@@ -260,29 +267,21 @@ class WindowsCredentialStore(TokenStore):
             OSError: If credential deletion fails
         """
         if not self._available:
-            from freecad_gitpdm.core import log
-
             log.error("Windows Credential Manager not available")
             raise OSError("Windows Credential Manager not available")
 
-        from freecad_gitpdm.core import log
-
         targets = [credential_target_name(host, account)]
         if account:
             targets.append(credential_target_name(host, None))
 
         # De-dup while preserving order
-        seen = set()
-        targets = [t for t in targets if not (t in seen or seen.add(t))]
+        targets = list(dict.fromkeys(targets))
 
         for target_name in targets:
             log.debug(
                 f"Deleting token for {target_name} from Windows Credential Manager"
             )
 
-            # Clear any previous error state
-            ctypes.set_last_error(0)
-
             result = self._cred_delete(
                 ctypes.c_wchar_p(target_name),
                 CRED_TYPE_GENERIC,
@@ -291,7 +290,8 @@ class WindowsCredentialStore(TokenStore):
 
             if not result:
                 error_code = ctypes.get_last_error()
-                # ERROR_NOT_FOUND = 1168, but also treat 0 as "not found"
+                # ERROR_NOT_FOUND = 1168; also treat 0 (no error recorded)
+                # as "not found"
                 if error_code == 1168 or error_code == 0:
                     log.debug(
                         f"Token not found for {target_name} (error code: {error_code})"
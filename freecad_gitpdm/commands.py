@@ -22,6 +22,39 @@ from freecad_gitpdm.core import log, settings
 # code doesn't need updating on the next Qt major-version bump.
 from PySide import QtCore, QtWidgets
 
+# Must match GitPDMDockWidget's setObjectName() in ui/panel.py.
+DOCK_OBJECT_NAME = "GitPDM_DockWidget"
+# Existing FreeCAD docks to tab alongside, in order of preference.
+_TAB_TARGET_NAMES = ("Report view", "Python console")
+_DOCK_AREA = QtCore.Qt.LeftDockWidgetArea
+
+# The resolved dock, cached so every entry point (each workbench switch,
+# each menu command) doesn't walk the main window's whole widget tree via
+# findChild. Cleared when Qt destroys the dock.
+_dock = None
+
+
+def _forget_dock(*_args):
+    global _dock
+    _dock = None
+
+
+def _remember_dock(dock):
+    global _dock
+    _dock = dock
+    dock.destroyed.connect(_forget_dock)
+    return dock
+
+
+def _find_dock(mw):
+    """Return the existing GitPDM dock widget, or None if not created yet."""
+    if _dock is not None:
+        return _dock
+    dock = mw.findChild(QtWidgets.QDockWidget, DOCK_OBJECT_NAME)
+    if dock is None:
+        return None
+    return _remember_dock(dock)
+
 
 def _find_or_create_dock():
     """Find the GitPDM dock widget, creating (but not showing) it if needed.
@@ -39,21 +72,26 @@ def _find_or_create_dock():
     from freecad_gitpdm.ui import panel
 
     mw = FreeCADGui.getMainWindow()
-    dock = mw.findChild(QtWidgets.QDockWidget, "GitPDM_DockWidget")
+    dock = _find_dock(mw)
 
     if dock is None:
         log.info("Creating GitPDM dock panel")
         from freecad_gitpdm.core.services import get_services
 
-        dock = panel.GitPDMDockWidget(services=get_services())
+        dock = _remember_dock(panel.GitPDMDockWidget(services=get_services()))
 
+        # One findChildren pass over the docks instead of a full findChild
+        # tree walk per candidate name.
+        docks_by_name = {
+            d.objectName(): d for d in mw.findChildren(QtWidgets.QDockWidget)
+        }
         tab_target = None
-        for name in ["Report view", "Python console"]:
-            tab_target = mw.findChild(QtWidgets.QDockWidget, name)
+        for name in _TAB_TARGET_NAMES:
+            tab_target = docks_by_name.get(name)
             if tab_target:
                 break
 
-        mw.addDockWidget(QtCore.Qt.LeftDockWidgetArea, dock)
+        mw.addDockWidget(_DOCK_AREA, dock)
         if tab_target:
             mw.tabifyDockWidget(tab_target, dock)
 
@@ -88,7 +126,7 @@ class GitPDMTogglePanelCommand:
         Called when the command is executed
         """
         mw = FreeCADGui.getMainWindow()
-        dock = mw.findChild(QtWidgets.QDockWidget, "GitPDM_DockWidget")
+        dock = _find_dock(mw)
 
         if dock is None:
             dock = _find_or_create_dock()
@@ -5,8 +5,19 @@ GitPDM Core Module
 Sprint 1: Core utilities package
 """
 
-from . import log
-from . import settings
-from . import jobs
+import importlib
 
-__all__ = ["log", "settings", "jobs"]
+# Loaded on first attribute access (PEP 562) -- see freecad_gitpdm/__init__.py.
+_LAZY_SUBMODULES = ("log", "settings", "jobs", "services")
+
+__all__ = list(_LAZY_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -424,8 +424,12 @@ def note_last_checkpoint_file(repo_root: str, file_path: str) -> None:
     try:
         path = _last_checkpoint_marker_path(repo_root)
         payload = {"file": file_path, "at": datetime.now(timezone.utc).isoformat()}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
+        # Via a sibling temp file: a crash mid-write (the case this marker
+        # exists for) must leave the previous marker, not a truncated one.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(payload).encode("utf-8"))
+        os.replace(tmp_path, path)
     except OSError as e:
         log.warning(f"Could not persist last-checkpoint-file marker: {e}")
 
@@ -434,8 +438,8 @@ def load_last_checkpoint_file(repo_root: str) -> str:
     """Load the path recorded by note_last_checkpoint_file(), or "" if
     none is recorded (or repo_root doesn't look like a repo yet)."""
     try:
-        with open(_last_checkpoint_marker_path(repo_root), "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(_last_checkpoint_marker_path(repo_root), "rb") as f:
+            data = json.loads(f.read())
         return str(data.get("file", "") or "")
     except (FileNotFoundError, OSError, ValueError, KeyError, TypeError):
         return ""
@@ -9,41 +9,43 @@ support requests. Includes OAuth configuration status but
 never includes sensitive data like tokens.
 """
 
+import functools
 import sys
 import platform
 from freecad_gitpdm.core import settings, log
 
 
-def get_diagnostics():
-    """
-    Collect diagnostic information about GitPDM configuration.
+# The three probes below can't change while FreeCAD is running, and
+# platform.platform() in particular is slow (uname plus reading the OS
+# release files), so each runs once and later reports reuse the result.
 
-    Returns:
-        dict: Diagnostic information
 
-    Notes:
-        Never includes sensitive data (tokens, passwords, etc.)
-    """
-    diagnostics = {}
+@functools.cache
+def _platform_info():
+    return {
+        "python_version": sys.version,
+        "platform": platform.platform(),
+        "platform_system": platform.system(),
+        "platform_release": platform.release(),
+    }
 
-    # Python and platform information
-    diagnostics["python_version"] = sys.version
-    diagnostics["platform"] = platform.platform()
-    diagnostics["platform_system"] = platform.system()
-    diagnostics["platform_release"] = platform.release()
 
-    # FreeCAD version
+@functools.cache
+def _freecad_info():
     try:
         import FreeCAD
 
-        diagnostics["freecad_version"] = (
-            f"{FreeCAD.Version()[0]}.{FreeCAD.Version()[1]}.{FreeCAD.Version()[2]}"
-        )
-        diagnostics["freecad_build"] = FreeCAD.Version()[3]
+        version = FreeCAD.Version()
+        return {
+            "freecad_version": f"{version[0]}.{version[1]}.{version[2]}",
+            "freecad_build": version[3],
+        }
     except Exception as e:
-        diagnostics["freecad_version"] = f"Error: {e}"
-        diagnostics["freecad_build"] = "Unknown"
+        return {"freecad_version": f"Error: {e}", "freecad_build": "Unknown"}
+
 
+@functools.cache
+def _qt_info():
     # Qt binding -- go through FreeCAD's own "PySide" compatibility shim
     # rather than guessing PySide6/PySide2 ourselves. QtCore.__name__ still
     # reveals the real underlying binding (e.g. "PySide6.QtCore") because
@@ -51,13 +53,15 @@ def get_diagnostics():
     try:
         from PySide import QtCore
 
-        diagnostics["qt_binding"] = getattr(QtCore, "__name__", "PySide").split(".")[0]
-        diagnostics["qt_version"] = QtCore.qVersion()
+        return {
+            "qt_binding": getattr(QtCore, "__name__", "PySide").split(".")[0],
+            "qt_version": QtCore.qVersion(),
+        }
     except ImportError:
-        diagnostics["qt_binding"] = "None"
-        diagnostics["qt_version"] = "None"
+        return {"qt_binding": "None", "qt_version": "None"}
 
-    # Git availability
+
+def _add_git_info(diagnostics):
     try:
         from freecad_gitpdm.git import client
 
@@ -69,6 +73,33 @@ def get_diagnostics():
         diagnostics["git_available"] = False
         diagnostics["git_version"] = f"Error: {e}"
 
+
+def get_diagnostics(include_git=False):
+    """
+    Collect diagnostic information about GitPDM configuration.
+
+    Args:
+        include_git: Also probe the git executable. Off by default: until
+            git has been found once, that probe spawns `git --version`,
+            which costs far more than everything else here combined.
+
+    Returns:
+        dict: Diagnostic information
+
+    Notes:
+        Never includes sensitive data (tokens, passwords, etc.)
+    """
+    diagnostics = {}
+
+    # Process-invariant environment info, probed once per session
+    diagnostics.update(_platform_info())
+    diagnostics.update(_freecad_info())
+    diagnostics.update(_qt_info())
+
+    # Git availability
+    if include_git:
+        _add_git_info(diagnostics)
+
     # Repository configuration
     try:
         repo_path = settings.load_repo_path()
@@ -91,27 +122,24 @@ def get_diagnostics():
 
     # GitHub connection status (Sprint OAUTH-0, Sprint OAUTH-6)
     try:
-        diagnostics["github_connected"] = settings.load_github_connected()
-        github_login = settings.load_github_login()
-        diagnostics["github_login"] = github_login if github_login else None
-        diagnostics["github_host"] = settings.load_github_host()
-        diagnostics["github_user_id"] = settings.load_github_user_id()
-        diagnostics["last_verified_at"] = settings.load_last_verified_at()
+        github = settings.load_github_state()
+        diagnostics["github_connected"] = github["connected"]
+        diagnostics["github_login"] = github["login"]
+        diagnostics["github_host"] = github["host"]
+        diagnostics["github_user_id"] = github["user_id"]
+        diagnostics["last_verified_at"] = github["last_verified_at"]
         # Token presence (yes/no) without exposing token
         try:
             from freecad_gitpdm.auth.token_store_factory import create_token_store
 
             store = create_token_store()
-            token_present = (
-                store.load(settings.load_github_host(), settings.load_github_login())
-                is not None
-            )
+            token_present = store.load(github["host"], github["login"]) is not None
             diagnostics["token_present"] = token_present
         except Exception:
             diagnostics["token_present"] = False
 
         # Last API error (Sprint OAUTH-6)
-        code, msg = settings.load_last_api_error()
+        code, msg = github["last_api_error"]
         diagnostics["last_api_error_code"] = code or None
         diagnostics["last_api_error_message"] = msg or None
 
@@ -143,85 +171,92 @@ def get_diagnostics():
     return diagnostics
 
 
+# format_diagnostics() fills this in one pass. Missing keys render as
+# "None", the same as the dict.get() lookups they replace.
+_REPORT_TEMPLATE = """\
+=== GitPDM Diagnostics ===
+
+Platform:
+  System: {platform_system}
+  Release: {platform_release}
+  Platform: {platform}
+
+Python:
+  Version: {python_first_line}
+
+FreeCAD:
+  Version: {freecad_version}
+  Build: {freecad_build}
+
+Qt:
+  Binding: {qt_binding}
+  Version: {qt_version}
+
+Git:
+  Available: {git_available}
+  Version: {git_version}
+
+Repository:
+  Configured: {repo_path_configured}
+
+GitHub OAuth:
+  Client ID configured: {oauth_client_id_configured}
+  Connected: {github_connected}
+  Login: {login_display}
+  Host: {github_host}
+  Token present: {token_present}
+  User ID: {uid_display}
+  Last verified: {verified_display}
+{api_error_block}Cache:
+  Hits: {cache_hits}
+  Misses: {cache_misses}
+
+=== End Diagnostics ==="""
+
+
+class _ReportFields(dict):
+    def __missing__(self, key):
+        return None
+
+
 def format_diagnostics(diagnostics=None):
     """
     Format diagnostics as human-readable text.
 
     Args:
-        diagnostics: dict from get_diagnostics() (or None to fetch)
+        diagnostics: dict from get_diagnostics() (or None to fetch,
+            including the git probe)
 
     Returns:
         str: Formatted diagnostic report
     """
     if diagnostics is None:
-        diagnostics = get_diagnostics()
-
-    lines = []
-    lines.append("=== GitPDM Diagnostics ===")
-    lines.append("")
-
-    lines.append("Platform:")
-    lines.append(f"  System: {diagnostics.get('platform_system')}")
-    lines.append(f"  Release: {diagnostics.get('platform_release')}")
-    lines.append(f"  Platform: {diagnostics.get('platform')}")
-    lines.append("")
+        diagnostics = get_diagnostics(include_git=True)
 
-    lines.append("Python:")
+    d = _ReportFields(diagnostics)
     py_ver = diagnostics.get("python_version", "Unknown")
     # Show just version line, not full details
-    first_line = py_ver.split("\n")[0] if py_ver else "Unknown"
-    lines.append(f"  Version: {first_line}")
-    lines.append("")
-
-    lines.append("FreeCAD:")
-    lines.append(f"  Version: {diagnostics.get('freecad_version')}")
-    lines.append(f"  Build: {diagnostics.get('freecad_build')}")
-    lines.append("")
-
-    lines.append("Qt:")
-    lines.append(f"  Binding: {diagnostics.get('qt_binding')}")
-    lines.append(f"  Version: {diagnostics.get('qt_version')}")
-    lines.append("")
-
-    lines.append("Git:")
-    lines.append(f"  Available: {diagnostics.get('git_available')}")
-    lines.append(f"  Version: {diagnostics.get('git_version')}")
-    lines.append("")
-
-    lines.append("Repository:")
-    lines.append(f"  Configured: {diagnostics.get('repo_path_configured')}")
-    lines.append("")
-
-    lines.append("GitHub OAuth:")
-    lines.append(
-        f"  Client ID configured: {diagnostics.get('oauth_client_id_configured')}"
-    )
-    lines.append(f"  Connected: {diagnostics.get('github_connected')}")
+    d["python_first_line"] = py_ver.split("\n")[0] if py_ver else "Unknown"
     github_login = diagnostics.get("github_login")
-    lines.append(f"  Login: {github_login if github_login else 'None'}")
-    lines.append(f"  Host: {diagnostics.get('github_host')}")
-    lines.append(f"  Token present: {diagnostics.get('token_present')}")
+    d["login_display"] = github_login if github_login else "None"
     uid = diagnostics.get("github_user_id")
-    lines.append(f"  User ID: {uid if uid is not None else 'None'}")
+    d["uid_display"] = uid if uid is not None else "None"
     lv = diagnostics.get("last_verified_at")
-    lines.append(f"  Last verified: {lv if lv else 'Never'}")
+    d["verified_display"] = lv if lv else "Never"
+    d["cache_hits"] = diagnostics.get("cache_hits", 0)
+    d["cache_misses"] = diagnostics.get("cache_misses", 0)
+
     lec = diagnostics.get("last_api_error_code")
     lem = diagnostics.get("last_api_error_message")
-    if lec or lem:
-        lines.append("  Last API error:")
-        lines.append(f"    Code: {lec if lec else 'Unknown'}")
-        lines.append(f"    Message: {lem if lem else ''}")
-
-    # Cache statistics (Sprint OAUTH-6)
-    lines.append("Cache:")
-    lines.append(f"  Hits: {diagnostics.get('cache_hits', 0)}")
-    lines.append(f"  Misses: {diagnostics.get('cache_misses', 0)}")
-
-    lines.append("")
-
-    lines.append("=== End Diagnostics ===")
+    d["api_error_block"] = (
+        "  Last API error:\n"
+        f"    Code: {lec if lec else 'Unknown'}\n"
+        f"    Message: {lem if lem else ''}\n"
+        if lec or lem
+        else ""
+    )
 
-    return "\n".join(lines)
+    return _REPORT_TEMPLATE.format_map(d)
 
 
 def print_diagnostics():
@@ -229,7 +264,7 @@ def print_diagnostics():
     Print diagnostics to FreeCAD console.
     Useful for troubleshooting and support.
     """
-    diagnostics = get_diagnostics()
+    diagnostics = get_diagnostics(include_git=True)
     report = format_diagnostics(diagnostics)
     log.info(report)
     return report
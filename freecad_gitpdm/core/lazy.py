@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: MIT
+# -*- coding: utf-8 -*-
+"""
+GitPDM Lazy Module Imports
+
+`lazy_import(name)` returns a stand-in that does the real import on first
+attribute access, then caches the module. Lets code that FreeCAD runs on
+every workbench switch (see freecad_gitpdm/workbench.py) bind its Qt/panel
+dependencies once at module scope instead of re-importing them inside each
+call, without paying for those imports until they're actually used.
+
+Deliberately FreeCAD-agnostic -- nothing here imports FreeCAD or Qt itself.
+"""
+
+from __future__ import annotations
+
+import importlib
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Module proxy that imports its target on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        target = self.__dict__["_lazy_target"]
+        if target is None:
+            target = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_target"] = target
+        return target
+
+    def __getattr__(self, attr: str):
+        # Only reached for names not already on the proxy itself, i.e.
+        # every real module attribute.
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return a proxy for module `name` that imports it on first use.
+
+    If the module is already in sys.modules the proxy still defers the
+    lookup, so binding one at module scope never triggers an import by
+    itself. An ImportError surfaces at first attribute access, not here.
+    """
+    return _LazyModule(name)
@@ -6,7 +6,47 @@ Sprint 1: Lightweight logging to FreeCAD console
 Sprint OAUTH-1: Token redaction to prevent secrets in logs
 """
 
+import os
 import re
+import sys
+
+# debug() and debug_safe() are no-ops unless GITPDM_LOG_LEVEL=DEBUG was set
+# when FreeCAD started: debug lines are the high-volume ones, and skipping
+# them up front also skips their redaction and console call.
+_DEBUG_ENABLED = os.environ.get("GITPDM_LOG_LEVEL", "").strip().upper() == "DEBUG"
+
+# Compiled once at import: redaction runs on every log line, and re.sub()
+# with a pattern string pays a cache lookup per call per pattern.
+
+# GitHub OAuth access tokens (ghp_XXXX) and Personal Access Tokens
+# (github_pat_XXXX), in one pass
+_GITHUB_TOKEN_RE = re.compile(r"ghp_[a-zA-Z0-9_]+|github_pat_[a-zA-Z0-9_]+")
+
+# Refresh tokens (usually long base64 or similar) in JSON,
+# i.e. "refresh_token": "..."
+_REFRESH_TOKEN_JSON_RE = re.compile(r'("refresh_token"\s*:\s*)"([^"]*)"', re.IGNORECASE)
+
+# Access tokens in JSON, i.e. "access_token": "..."
+_ACCESS_TOKEN_JSON_RE = re.compile(r'("access_token"\s*:\s*)"([^"]*)"', re.IGNORECASE)
+
+# Any "token" key that looks like it contains a real token
+_TOKEN_JSON_RE = re.compile(r'"token"\s*:\s*"([a-zA-Z0-9_\-\.]+)"', re.IGNORECASE)
+
+# Authorization: Bearer <token> header-like strings
+_BEARER_RE = re.compile(
+    r"(Authorization\s*:\s*Bearer)\s+[A-Za-z0-9_\-\.~=+/]+", re.IGNORECASE
+)
+
+# Every pattern above needs one of these (lowercased) substrings to match,
+# so a line containing none of them -- nearly all of them -- skips the
+# regex passes entirely.
+_REDACT_TRIGGERS = ("ghp_", "github_pat_", "token", "authorization")
+
+
+def _github_token_placeholder(match):
+    if match.group().startswith("github_pat_"):
+        return "[REDACTED_PAT]"
+    return "[REDACTED_ACCESS_TOKEN]"
 
 
 def _redact_sensitive(message):
@@ -29,49 +69,43 @@ def _redact_sensitive(message):
         return message
 
     msg = str(message)
+    lowered = msg.lower()
+    if not any(trigger in lowered for trigger in _REDACT_TRIGGERS):
+        return msg
+
+    msg = _GITHUB_TOKEN_RE.sub(_github_token_placeholder, msg)
+    msg = _REFRESH_TOKEN_JSON_RE.sub(r'\1"[REDACTED_REFRESH_TOKEN]"', msg)
+    msg = _ACCESS_TOKEN_JSON_RE.sub(r'\1"[REDACTED_ACCESS_TOKEN]"', msg)
+    msg = _TOKEN_JSON_RE.sub(r'"token": "[REDACTED_TOKEN]"', msg)
+    msg = _BEARER_RE.sub(r"\1 [REDACTED]", msg)
+    return msg
 
-    # Redact GitHub OAuth access tokens (ghp_XXXX)
-    msg = re.sub(r"ghp_[a-zA-Z0-9_]+", "[REDACTED_ACCESS_TOKEN]", msg)
-
-    # Redact GitHub Personal Access Tokens (github_pat_XXXX)
-    msg = re.sub(r"github_pat_[a-zA-Z0-9_]+", "[REDACTED_PAT]", msg)
-
-    # Redact refresh tokens (usually long base64 or similar)
-    # Look for "refresh_token": "..." patterns in JSON
-    msg = re.sub(
-        r'("refresh_token"\s*:\s*)"([^"]*)"',
-        r'\1"[REDACTED_REFRESH_TOKEN]"',
-        msg,
-        flags=re.IGNORECASE,
-    )
-
-    # Redact access tokens in JSON
-    # Look for "access_token": "..." patterns in JSON
-    msg = re.sub(
-        r'("access_token"\s*:\s*)"([^"]*)"',
-        r'\1"[REDACTED_ACCESS_TOKEN]"',
-        msg,
-        flags=re.IGNORECASE,
-    )
-
-    # Redact token_type if it's a bearer token (less critical but good practice)
-    # Redact any "token" key that looks like it contains a real token
-    msg = re.sub(
-        r'"token"\s*:\s*"([a-zA-Z0-9_\-\.]+)"',
-        r'"token": "[REDACTED_TOKEN]"',
-        msg,
-        flags=re.IGNORECASE,
-    )
-
-    # Redact Authorization: Bearer <token> header-like strings
-    msg = re.sub(
-        r"(Authorization\s*:\s*Bearer)\s+[A-Za-z0-9_\-\.~=+/]+",
-        r"\1 [REDACTED]",
-        msg,
-        flags=re.IGNORECASE,
-    )
 
-    return msg
+def _console():
+    """FreeCAD.Console, or None outside FreeCAD.
+
+    FreeCAD's module is already loaded in any real session, so this is a
+    sys.modules lookup rather than an import statement per log call. Looked
+    up each time rather than bound once, so it always follows whatever
+    module is currently registered as FreeCAD.
+    """
+    freecad = sys.modules.get("FreeCAD")
+    if freecad is None:
+        try:
+            import FreeCAD as freecad
+        except ImportError:
+            return None
+    return freecad.Console
+
+
+def _emit(print_name, level, message):
+    line = f"[GitPDM] {level}: {_redact_sensitive(str(message))}"
+    console = _console()
+    if console is None:
+        # FreeCAD not available, fall back to print
+        print(line)
+    else:
+        getattr(console, print_name)(line + "\n")
 
 
 def info(message):
@@ -81,14 +115,7 @@ def info(message):
     Args:
         message: Message to log
     """
-    try:
-        import FreeCAD
-
-        safe_msg = _redact_sensitive(str(message))
-        FreeCAD.Console.PrintLog(f"[GitPDM] INFO: {safe_msg}\n")
-    except ImportError:
-        # FreeCAD not available, fall back to print
-        print(f"[GitPDM] INFO: {message}")
+    _emit("PrintLog", "INFO", message)
 
 
 def warning(message):
@@ -98,13 +125,7 @@ def warning(message):
     Args:
         message: Warning message to log
     """
-    try:
-        import FreeCAD
-
-        safe_msg = _redact_sensitive(str(message))
-        FreeCAD.Console.PrintWarning(f"[GitPDM] WARNING: {safe_msg}\n")
-    except ImportError:
-        print(f"[GitPDM] WARNING: {message}")
+    _emit("PrintWarning", "WARNING", message)
 
 
 def error(message):
@@ -114,29 +135,19 @@ def error(message):
     Args:
         message: Error message to log
     """
-    try:
-        import FreeCAD
-
-        safe_msg = _redact_sensitive(str(message))
-        FreeCAD.Console.PrintError(f"[GitPDM] ERROR: {safe_msg}\n")
-    except ImportError:
-        print(f"[GitPDM] ERROR: {message}")
+    _emit("PrintError", "ERROR", message)
 
 
 def debug(message):
     """
-    Log a debug message (currently same as info)
+    Log a debug message (only with GITPDM_LOG_LEVEL=DEBUG)
 
     Args:
         message: Debug message to log
     """
-    try:
-        import FreeCAD
-
-        safe_msg = _redact_sensitive(str(message))
-        FreeCAD.Console.PrintLog(f"[GitPDM] DEBUG: {safe_msg}\n")
-    except ImportError:
-        print(f"[GitPDM] DEBUG: {message}")
+    if not _DEBUG_ENABLED:
+        return
+    _emit("PrintLog", "DEBUG", message)
 
 
 def error_safe(message, exception=None):
@@ -179,6 +190,8 @@ def debug_safe(message, exception=None):
         message: Debug message prefix
         exception: Optional exception object to include (will be redacted)
     """
+    if not _DEBUG_ENABLED:
+        return
     if exception:
         safe_exc = _redact_sensitive(str(exception))
         full_msg = f"{message}: {safe_exc}"
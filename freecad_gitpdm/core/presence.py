@@ -33,6 +33,7 @@ from __future__ import annotations
 import json
 import os
 import socket
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
@@ -54,6 +55,23 @@ STALE_PRESENCE_SECONDS = 15 * 60
 # advisory data, not a guarantee, so we don't retry indefinitely.
 _MAX_WRITE_ATTEMPTS = 2
 
+# repo_root -> (config file mtimes, time.monotonic() resolved, (user, host)).
+# _own_identity() runs on every open/heartbeat/close, and resolving it costs
+# up to four `git config` subprocesses; the answer only changes when one of
+# the config files does, so their mtimes are the cache key. Files the stamp
+# can't see (include/includeIf targets) are covered by also re-resolving
+# after _IDENTITY_TTL_SECONDS.
+_identity_cache: dict = {}
+_IDENTITY_TTL_SECONDS = 60.0
+
+# repo_root -> time.monotonic() of our last presence fetch, dropped again
+# if a push of ours is then rejected (the local ref is behind). Opening an
+# assembly fires announce_open() for every linked part at once; within this
+# window they reuse the fetched state instead of each paying a network
+# round-trip first.
+_FETCH_REUSE_SECONDS = 5.0
+_last_fetch: dict = {}
+
 
 @dataclass
 class PresenceEntry:
@@ -108,8 +126,15 @@ def announce_open(
 def heartbeat(git_client, repo_root: str, file_rel_path: str) -> None:
     """Call periodically while a document stays open, so our entry doesn't
     look abandoned to other users. Best-effort; never raises."""
+    heartbeat_files(git_client, repo_root, [file_rel_path])
+
+
+def heartbeat_files(git_client, repo_root: str, file_rel_paths) -> None:
+    """heartbeat() for several open documents at once: one presence commit
+    and one push for all of them, instead of one (plus a CAS race against
+    the others) per file. Best-effort; never raises."""
     try:
-        _heartbeat_impl(git_client, repo_root, file_rel_path)
+        _heartbeat_impl(git_client, repo_root, list(file_rel_paths))
     except Exception as e:
         log.debug(f"Presence heartbeat failed (non-fatal): {e}")
 
@@ -117,8 +142,15 @@ def heartbeat(git_client, repo_root: str, file_rel_path: str) -> None:
 def announce_close(git_client, repo_root: str, file_rel_path: str) -> None:
     """Call when a document is closed, so other users stop seeing it as
     open. Best-effort; never raises. Never removes another user's entry."""
+    announce_close_files(git_client, repo_root, [file_rel_path])
+
+
+def announce_close_files(git_client, repo_root: str, file_rel_paths) -> None:
+    """announce_close() for several documents at once (e.g. every file still
+    open when the panel closes), as one commit and one push. Best-effort;
+    never raises."""
     try:
-        _announce_close_impl(git_client, repo_root, file_rel_path)
+        _announce_close_impl(git_client, repo_root, list(file_rel_paths))
     except Exception as e:
         log.debug(f"Presence announce_close failed (non-fatal): {e}")
 
@@ -126,20 +158,63 @@ def announce_close(git_client, repo_root: str, file_rel_path: str) -> None:
 # --- internals ------------------------------------------------------------
 
 
+def _config_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _identity_config_paths(repo_root: str) -> tuple:
+    """Every config file git reads user.name/user.email from for repo_root:
+    local, global (or GIT_CONFIG_GLOBAL), XDG, and system."""
+    home = os.path.expanduser("~")
+    xdg_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    if os.name == "nt":
+        program_files = os.environ.get("PROGRAMFILES", r"C:\Program Files")
+        system_default = os.path.join(program_files, "Git", "etc", "gitconfig")
+    else:
+        system_default = "/etc/gitconfig"
+    return (
+        os.path.join(repo_root, ".git", "config"),
+        os.environ.get("GIT_CONFIG_GLOBAL") or os.path.join(home, ".gitconfig"),
+        os.path.join(xdg_home, "git", "config"),
+        os.environ.get("GIT_CONFIG_SYSTEM") or system_default,
+    )
+
+
 def _own_identity(git_client, repo_root: str) -> tuple[str, str]:
     """Effective (local-overrides-global) user.name/user.email for
     repo_root. GitClient.get_config()'s `local` flag is an explicit
     either/or (not "prefer local"), so the fallback is done here: try the
     repo-local value first, then the global one, matching what a plain
     `git commit` in this repo would actually use."""
+    stamp = tuple(_config_mtime(path) for path in _identity_config_paths(repo_root))
+    now = time.monotonic()
+    cached = _identity_cache.get(repo_root)
+    if (
+        cached is not None
+        and cached[0] == stamp
+        and now - cached[1] < _IDENTITY_TTL_SECONDS
+    ):
+        return cached[2]
+
     name = git_client.get_config(
         repo_root, "user.name", local=True
     ) or git_client.get_config(repo_root, "user.name")
     email = git_client.get_config(
         repo_root, "user.email", local=True
     ) or git_client.get_config(repo_root, "user.email")
-    user = name or email or "unknown"
-    return user, socket.gethostname()
+    identity = (name or email or "unknown", socket.gethostname())
+    # An unresolved identity isn't cached: it's most likely about to be
+    # configured, and presence ownership checks depend on it. Neither is an
+    # answer no stamped file backs (all missing), since nothing would then
+    # ever invalidate it.
+    if (name or email) and any(mtime is not None for mtime in stamp):
+        _identity_cache[repo_root] = (stamp, now, identity)
+    else:
+        _identity_cache.pop(repo_root, None)
+    return identity
 
 
 def _parse_timestamp(value: str) -> Optional[datetime]:
@@ -199,16 +274,31 @@ def _write_presence_map(git_client, repo_root: str, data: dict, message: str) ->
     return update_result.ok
 
 
+def _fetch_presence(git_client, repo_root: str, force: bool = False) -> None:
+    fetched_at = _last_fetch.get(repo_root)
+    if (
+        not force
+        and fetched_at is not None
+        and time.monotonic() - fetched_at < _FETCH_REUSE_SECONDS
+    ):
+        return
+    git_client.fetch_ref(repo_root, PRESENCE_REF)
+    _last_fetch[repo_root] = time.monotonic()
+
+
 def _push_presence(git_client, repo_root: str) -> None:
     result = git_client.push_ref(repo_root, PRESENCE_REF)
     if not result.ok:
+        # Most likely someone else pushed first: our local view is behind,
+        # so the next open must fetch rather than reuse it.
+        _last_fetch.pop(repo_root, None)
         log.debug(f"Presence branch push failed (non-fatal): {result.stderr}")
 
 
 def _announce_open_impl(
     git_client, repo_root: str, file_rel_path: str
 ) -> Optional[PresenceEntry]:
-    git_client.fetch_ref(repo_root, PRESENCE_REF)
+    _fetch_presence(git_client, repo_root)
 
     user, host = _own_identity(git_client, repo_root)
     now = datetime.now(timezone.utc)
@@ -248,58 +338,66 @@ def _announce_open_impl(
             return other
 
         if attempt + 1 < _MAX_WRITE_ATTEMPTS:
-            git_client.fetch_ref(repo_root, PRESENCE_REF)
+            _fetch_presence(git_client, repo_root, force=True)
 
     return other
 
 
-def _heartbeat_impl(git_client, repo_root: str, file_rel_path: str) -> None:
+def _heartbeat_impl(git_client, repo_root: str, file_rel_paths: list) -> None:
+    if not file_rel_paths:
+        return
     user, host = _own_identity(git_client, repo_root)
     now_iso = datetime.now(timezone.utc).isoformat()
+    message = f"GitPDM presence: heartbeat {', '.join(file_rel_paths)}"
 
     for attempt in range(_MAX_WRITE_ATTEMPTS):
         data = dict(_load_presence_map(git_client, repo_root))
-        existing = data.get(file_rel_path)
-        opened_at = existing.get("opened_at") if existing else now_iso
-
-        data[file_rel_path] = {
-            "user": user,
-            "host": host,
-            "opened_at": opened_at,
-            "last_heartbeat": now_iso,
-        }
-
-        if _write_presence_map(
-            git_client, repo_root, data, f"GitPDM presence: heartbeat {file_rel_path}"
-        ):
+        for file_rel_path in file_rel_paths:
+            existing = data.get(file_rel_path)
+            opened_at = existing.get("opened_at") if existing else now_iso
+
+            data[file_rel_path] = {
+                "user": user,
+                "host": host,
+                "opened_at": opened_at,
+                "last_heartbeat": now_iso,
+            }
+
+        if _write_presence_map(git_client, repo_root, data, message):
             _push_presence(git_client, repo_root)
             return
 
         if attempt + 1 < _MAX_WRITE_ATTEMPTS:
-            git_client.fetch_ref(repo_root, PRESENCE_REF)
+            _fetch_presence(git_client, repo_root, force=True)
 
 
-def _announce_close_impl(git_client, repo_root: str, file_rel_path: str) -> None:
+def _announce_close_impl(git_client, repo_root: str, file_rel_paths: list) -> None:
     user, host = _own_identity(git_client, repo_root)
 
     for attempt in range(_MAX_WRITE_ATTEMPTS):
         data = dict(_load_presence_map(git_client, repo_root))
-        existing = data.get(file_rel_path)
-        if not existing:
-            return  # nothing to remove
-        if existing.get("user") != user or existing.get("host") != host:
-            return  # someone else's entry (e.g. we lost a prior race) -- not ours to remove
-
-        del data[file_rel_path]
+        # Only our own entries: one that's missing needs no removal, and a
+        # foreign one (e.g. we lost a prior race) is not ours to remove.
+        closing = [
+            path
+            for path in file_rel_paths
+            if data.get(path)
+            and data[path].get("user") == user
+            and data[path].get("host") == host
+        ]
+        if not closing:
+            return
+        for file_rel_path in closing:
+            del data[file_rel_path]
 
         if _write_presence_map(
-            git_client, repo_root, data, f"GitPDM presence: close {file_rel_path}"
+            git_client, repo_root, data, f"GitPDM presence: close {', '.join(closing)}"
         ):
             _push_presence(git_client, repo_root)
             return
 
         if attempt + 1 < _MAX_WRITE_ATTEMPTS:
-            git_client.fetch_ref(repo_root, PRESENCE_REF)
+            _fetch_presence(git_client, repo_root, force=True)
 
 
 __all__ = [
@@ -308,7 +406,9 @@ __all__ = [
     "describe_last_seen",
     "announce_open",
     "heartbeat",
+    "heartbeat_files",
     "announce_close",
+    "announce_close_files",
     "STALE_PRESENCE_SECONDS",
     "PRESENCE_FILENAME",
 ]
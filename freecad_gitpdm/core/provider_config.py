@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import json
 import os
+from dataclasses import dataclass, field
 from typing import Optional
 
 from freecad_gitpdm.core import log
@@ -38,31 +39,78 @@ def _config_path(repo_root: str) -> str:
     return os.path.join(repo_root, CONFIG_DIR, CONFIG_FILE)
 
 
-def _read_config(repo_root: str) -> dict:
+@dataclass(frozen=True)
+class ConfigProbe:
+    """One read of `.freecad-pdm/config.json`, answering every question
+    callers ask of it -- so a caller needing several fields (or the raw
+    dict, e.g. ui/repo_validator.py's legacy storageMode check) doesn't
+    re-open and re-parse the file per field."""
+
+    exists: bool
+    data: dict = field(default_factory=dict)
+
+    @property
+    def provider_id(self) -> str:
+        provider_id = (self.data.get("provider") or "").strip().lower()
+        if provider_id not in _KNOWN_PROVIDER_IDS:
+            return DEFAULT_PROVIDER_ID
+        return provider_id
+
+    @property
+    def remote_host(self) -> Optional[str]:
+        host = self.data.get("remoteHost")
+        return host.strip() if isinstance(host, str) and host.strip() else None
+
+
+# config path -> ((st_mtime_ns, st_size), ConfigProbe). The provider id is
+# looked up on every panel refresh and provider action, while the file
+# changes only through set_provider_config() (which drops the entry) or a
+# hand edit (which moves the stamp).
+_probe_cache: dict = {}
+
+
+def probe(repo_root: str) -> ConfigProbe:
+    """Read the repo's config once. Missing or malformed -> empty data."""
     path = _config_path(repo_root)
-    if not os.path.isfile(path):
-        return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
+        # stat() doubles as the existence check: no separate isfile().
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        _probe_cache.pop(path, None)
+        return ConfigProbe(exists=False)
+    except OSError as e:
+        log.warning(f"Could not read {CONFIG_DIR}/{CONFIG_FILE} ({e}); using defaults")
+        return ConfigProbe(exists=True)
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _probe_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        # Parsed from the raw bytes in one json.loads() (which detects the
+        # UTF encoding itself) rather than streamed through a text decoder.
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except (FileNotFoundError, NotADirectoryError):
+        return ConfigProbe(exists=False)
     except (OSError, ValueError) as e:
         log.warning(f"Could not read {CONFIG_DIR}/{CONFIG_FILE} ({e}); using defaults")
-        return {}
+        result = ConfigProbe(exists=True)
+    else:
+        result = ConfigProbe(exists=True, data=data if isinstance(data, dict) else {})
+    _probe_cache[path] = (stamp, result)
+    return result
 
 
 def get_provider_id(repo_root: str) -> str:
     """Return the repo's configured provider id, defaulting to 'github'."""
-    provider_id = (_read_config(repo_root).get("provider") or "").strip().lower()
-    if provider_id not in _KNOWN_PROVIDER_IDS:
-        return DEFAULT_PROVIDER_ID
-    return provider_id
+    return probe(repo_root).provider_id
 
 
 def get_remote_host(repo_root: str) -> Optional[str]:
     """Return the repo's configured remote host override, if any."""
-    host = _read_config(repo_root).get("remoteHost")
-    return host.strip() if isinstance(host, str) and host.strip() else None
+    return probe(repo_root).remote_host
 
 
 def set_provider_config(
@@ -77,18 +125,29 @@ def set_provider_config(
             f"Unknown provider id '{provider_id}'; expected one of {sorted(_KNOWN_PROVIDER_IDS)}"
         )
 
-    config_dir = os.path.join(repo_root, CONFIG_DIR)
-    os.makedirs(config_dir, exist_ok=True)
-
-    data = _read_config(repo_root)
+    current = probe(repo_root).data
+    data = dict(current)
     data["provider"] = provider_id
     if remote_host:
         data["remoteHost"] = remote_host.strip()
     else:
         data.pop("remoteHost", None)
 
-    with open(_config_path(repo_root), "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    # Re-selecting the same provider (e.g. re-opening a repo from the
+    # picker) leaves the file as it is rather than rewriting identical
+    # content.
+    if data == current:
+        return
+
+    os.makedirs(os.path.join(repo_root, CONFIG_DIR), exist_ok=True)
+    path = _config_path(repo_root)
+    payload = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    # Temp file + os.replace(), so an interrupted write never leaves a
+    # truncated config.json behind for probe() to read as malformed.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    _probe_cache.pop(path, None)
 
     log.info(f"Repo provider set to '{provider_id}'")
@@ -226,14 +226,17 @@ class PublishCoordinator:
         """
         self.current_step = PublishStep.COMMIT
 
-        if not message or not message.strip():
+        # Strip once and commit the stripped text, so the emptiness check
+        # and the commit work on the same string.
+        stripped = message.strip() if message else ""
+        if not stripped:
             return PublishResult(
                 ok=False,
                 step=PublishStep.COMMIT,
                 message="Empty commit message",
             )
 
-        cmd_result = self.git.commit(repo_root, message)
+        cmd_result = self.git.commit(repo_root, stripped)
 
         if not cmd_result.ok:
             if cmd_result.error_code == "NOTHING_TO_COMMIT":
@@ -289,6 +292,33 @@ class PublishCoordinator:
             message="Pushed to remote",
         )
 
+    def stage_commit_push(
+        self,
+        repo_root: str,
+        source_path: str,
+        export_result: exporter.ExportResult,
+        message: str,
+        stage_all: bool = False,
+        remote: str = "origin",
+    ) -> PublishResult:
+        """
+        Stage, commit and push in one call, stopping at the first failure.
+
+        Touches only git (no FreeCAD/Qt), so the UI can run it on a worker
+        thread and keep the push's network wait off the GUI thread.
+        """
+        result = self.stage_files(
+            repo_root, source_path, export_result, stage_all=stage_all
+        )
+        if not result.ok:
+            return result
+
+        result = self.commit_changes(repo_root, message)
+        if not result.ok:
+            return result
+
+        return self.push_to_remote(repo_root, remote)
+
     def request_abort(self):
         """Request coordinator to abort (best-effort)."""
         self.abort_requested = True
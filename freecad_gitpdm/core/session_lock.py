@@ -74,8 +74,8 @@ def _pid_alive(pid: int) -> bool:
 def _read_lock(repo_root: str) -> Optional[LockInfo]:
     path = _lock_path(repo_root)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
         return LockInfo(
             pid=int(data["pid"]),
             timestamp=str(data["timestamp"]),
@@ -96,8 +96,8 @@ def _write_lock(repo_root: str) -> None:
         "hostname": socket.gethostname(),
     }
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
+        with open(path, "wb") as f:
+            f.write(json.dumps(payload).encode("utf-8"))
     except OSError as e:
         # Advisory only - if we can't write the lock, proceed without one
         # rather than blocking repo activation.
@@ -536,6 +536,47 @@ def load_provider_last_api_error(provider_id: str):
     return (code or "", msg or "")
 
 
+def load_provider_state(provider_id: str, default_host: str = "") -> dict:
+    """
+    Load all of a provider's connection-state settings in one pass.
+
+    Same keys, defaults and normalization as the load_provider_* functions
+    above, but the parameter group is fetched once rather than per field.
+
+    Returns:
+        dict with keys connected, login, host, user_id, last_verified_at
+        and last_api_error (a (code, message) tuple)
+    """
+    prefix = _provider_key_prefix(provider_id)
+    try:
+        param_group = get_param_group()
+        connected = param_group.GetBool(f"{prefix}Connected", False)
+        login = param_group.GetString(f"{prefix}Login", "")
+        host = param_group.GetString(f"{prefix}Host", default_host)
+        raw_user_id = param_group.GetString(f"{prefix}UserId", "")
+        last_verified_at = param_group.GetString(f"{prefix}LastVerifiedAt", "")
+        code = param_group.GetString(f"{prefix}LastApiErrorCode", "")
+        msg = param_group.GetString(f"{prefix}LastApiErrorMessage", "")
+    except Exception as e:
+        log.error(f"Failed to load {prefix} connection settings: {e}")
+        connected, login, host = False, "", default_host
+        raw_user_id = last_verified_at = code = msg = ""
+
+    try:
+        user_id = int(raw_user_id) if raw_user_id else None
+    except ValueError:
+        user_id = None
+
+    return {
+        "connected": connected,
+        "login": login if login else None,
+        "host": host,
+        "user_id": user_id,
+        "last_verified_at": last_verified_at,
+        "last_api_error": (code or "", msg or ""),
+    }
+
+
 # --- Sprint OAUTH-0: GitHub OAuth settings (metadata only) ---
 # Thin wrappers over the provider-namespaced functions above, kept for
 # backward compatibility with existing callers (ui/github_auth.py etc.) -
@@ -572,6 +613,12 @@ def load_github_host():
     return load_provider_host("github", default_host="github.com")
 
 
+def load_github_state() -> dict:
+    """Load every GitHub connection-state setting at once (see
+    load_provider_state)."""
+    return load_provider_state("github", default_host="github.com")
+
+
 # --- Sprint OAUTH-2: Session verification metadata ---
 
 
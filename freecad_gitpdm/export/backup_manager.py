@@ -61,11 +61,10 @@ def move_fcbak_to_previews(
 
                     # Keep the timestamped name in the backup folder
                     fcbak_dest = backup_dir / fcbak_source.name
-                    # Remove existing FCBak if present (Windows won't overwrite on rename)
-                    if fcbak_dest.exists():
-                        fcbak_dest.unlink()
-                    # Move FCBak to the part's preview/Backup folder
-                    fcbak_source.rename(fcbak_dest)
+                    # Move FCBak to the part's preview/Backup folder. replace()
+                    # rather than rename(): it overwrites an existing FCBak
+                    # on Windows too, so no exists()/unlink() first.
+                    fcbak_source.replace(fcbak_dest)
                     log.info(f"FCBak moved to previews/Backup: {fcbak_dest.name}")
                     moved_successfully = True
 
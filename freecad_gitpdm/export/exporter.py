@@ -209,9 +209,8 @@ def export_active_document(repo_root: str) -> ExportResult:
             try:
                 if stl_root_abs:
                     stl_root_abs.parent.mkdir(parents=True, exist_ok=True)
-                    # Replace any existing STL in the root (Windows-safe overwrite)
-                    if stl_root_abs.exists():
-                        stl_root_abs.unlink()
+                    # Path.replace() (os.replace) overwrites an existing STL
+                    # in one step, on Windows too -- no unlink first.
                     try:
                         stl_path_in_part.replace(stl_root_abs)
                     except Exception:
@@ -20,22 +20,20 @@ def to_preview_dir_rel(source_rel: str) -> str:
       source:  cad/parts/BRK-001/BRK-001.FCStd
       output:  previews/cad/parts/BRK-001/BRK-001/
     """
-    p = Path(source_rel)
-    name = p.stem
-    rel_dir = p.parent.as_posix()
-    # Construct preview dir using POSIX-style separators
-    if rel_dir:
-        preview_dir = Path("previews") / rel_dir / name
-    else:
-        preview_dir = Path("previews") / name
-    return preview_dir.as_posix() + "/"
+    return _preview_dir_rel(Path(source_rel))
+
+
+def _preview_dir_rel(p: Path) -> str:
+    # One PurePath built from parts (a top-level source has no parent
+    # parts), rendered with POSIX-style separators.
+    return Path("previews", *p.parent.parts, p.stem).as_posix() + "/"
 
 
 def preview_paths_rel(source_rel: str) -> Tuple[str, str]:
     """Return (png_rel, json_rel) under preview dir."""
-    base = to_preview_dir_rel(source_rel)
-    # Extract part name from source path for consistent naming
     p = Path(source_rel)
+    base = _preview_dir_rel(p)
+    # Part name from the source path for consistent naming
     part_name = p.stem
     png_rel = base + f"{part_name}.png"
     json_rel = base + f"{part_name}.json"
@@ -52,7 +50,4 @@ def stl_root_path_rel(source_rel: str) -> str:
 
     The STL uses just the part name without the directory structure.
     """
-    p = Path(source_rel)
-    name = p.stem
-    stl_path = Path("previews") / f"{name}.stl"
-    return stl_path.as_posix()
+    return f"previews/{Path(source_rel).stem}.stl"
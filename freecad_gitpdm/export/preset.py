@@ -164,8 +164,12 @@ def load_preset(repo_root: Path) -> PresetResult:
     try:
         if not repo_root:
             raise ValueError("Missing repo_root")
-        preset_path = (repo_root / _PRESET_REL_PATH).resolve()
-        if not preset_path.is_file():
+        preset_path = repo_root / _PRESET_REL_PATH
+        try:
+            # The read doubles as the existence check: no resolve() (an
+            # lstat per path component) or is_file() stat up front.
+            raw = preset_path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
             log.info("Preset file missing; using defaults")
             return PresetResult(
                 preset=json.loads(json.dumps(_DEFAULT_PRESET)),
@@ -173,7 +177,6 @@ def load_preset(repo_root: Path) -> PresetResult:
                 error=None,
             )
         try:
-            raw = preset_path.read_text(encoding="utf-8")
             data = json.loads(raw)
         except Exception as e:
             log.warning(f"Preset parse failed: {e}")
@@ -5,6 +5,19 @@ GitPDM Git Module
 Sprint 1: Git operations
 """
 
-from . import client
+import importlib
+
+# Loaded on first attribute access (PEP 562) -- see freecad_gitpdm/__init__.py.
+_LAZY_SUBMODULES = ("client",)
 
 __all__ = ["client"]
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
@@ -10,8 +10,12 @@ from __future__ import annotations
 
 import subprocess
 import os
+import re
+import shutil
 import sys
 import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -19,6 +23,88 @@ from freecad_gitpdm.core import log
 from freecad_gitpdm.core.result import Result
 
 
+# stderr -> error-code tables for the _classify_*_error methods: one
+# case-insensitive regex per code, tried in priority order, so stderr is
+# never lowercased/copied and each tier is a single C-level scan. (A single
+# alternation would return whichever phrase appears *first in the text*,
+# not the highest-priority code, so the tiers stay separate.)
+_ERR_FLAGS = re.IGNORECASE | re.DOTALL
+_COMMIT_ERROR_PATTERNS = (
+    (
+        "NOTHING_TO_COMMIT",
+        re.compile(r"nothing to commit|no changes added to commit", _ERR_FLAGS),
+    ),
+    (
+        "MISSING_IDENTITY",
+        re.compile(r"user\.name|user\.email|please tell me who you are", _ERR_FLAGS),
+    ),
+)
+_PUSH_ERROR_PATTERNS = (
+    (
+        "AUTH_OR_PERMISSION",
+        re.compile(
+            r"authentication failed|permission denied"
+            r"|could not read from remote repository",
+            _ERR_FLAGS,
+        ),
+    ),
+    (
+        "NO_UPSTREAM",
+        re.compile(
+            r"no configured push destination|no upstream"
+            r"|set the remote as upstream",
+            _ERR_FLAGS,
+        ),
+    ),
+    (
+        "NO_REMOTE",
+        re.compile(
+            r"does not appear to be a git repository|no such remote", _ERR_FLAGS
+        ),
+    ),
+    ("REJECTED", re.compile(r"rejected|failed to push", _ERR_FLAGS)),
+)
+_PULL_ERROR_PATTERNS = (
+    (
+        "WORKING_TREE_DIRTY",
+        re.compile(
+            r"working tree.*dirty|dirty.*working tree"
+            r"|please commit your changes|local changes",
+            _ERR_FLAGS,
+        ),
+    ),
+    (
+        "DIVERGED_OR_NON_FF",
+        re.compile(
+            r"not possible to fast-forward|commit before merging|conflict", _ERR_FLAGS
+        ),
+    ),
+    (
+        "AUTH_OR_PERMISSION",
+        re.compile(
+            r"authentication failed|permission denied|fatal: could not read",
+            _ERR_FLAGS,
+        ),
+    ),
+    (
+        "NO_REMOTE",
+        re.compile(
+            r"no such remote|not a git repository"
+            r"|does not appear to be a git repository",
+            _ERR_FLAGS,
+        ),
+    ),
+)
+
+
+def _match_error_code(patterns, stderr_text):
+    """Return the first code in `patterns` whose regex matches, else UNKNOWN_ERROR."""
+    for code, pattern in patterns:
+        if pattern.search(stderr_text):
+            return code
+    return "UNKNOWN_ERROR"
+
+
 # Sprint PERF: Windows subprocess configuration to suppress console windows
 def _get_subprocess_kwargs():
     """
@@ -97,6 +183,52 @@ STATUS_UNTRACKED = "UNTRACKED"
 STATUS_CONFLICT = "CONFLICT"
 STATUS_UNKNOWN = "UNKNOWN"
 
+
+def _classify_xy(x_code, y_code):
+    """Classify porcelain XY codes into a status kind."""
+    if x_code == "?" and y_code == "?":
+        return STATUS_UNTRACKED
+
+    if "U" in (x_code, y_code):
+        return STATUS_CONFLICT
+
+    if (x_code == "A" and y_code == "D") or (x_code == "D" and y_code == "A"):
+        return STATUS_CONFLICT
+
+    if "R" in (x_code, y_code):
+        return STATUS_RENAMED
+
+    if "C" in (x_code, y_code):
+        return STATUS_COPIED
+
+    if "D" in (x_code, y_code):
+        return STATUS_DELETED
+
+    if "A" in (x_code, y_code):
+        return STATUS_ADDED
+
+    if "M" in (x_code, y_code) or "T" in (x_code, y_code):
+        return STATUS_MODIFIED
+
+    return STATUS_UNKNOWN
+
+
+# Prepended to the `git status` calls below, but only for repos whose
+# filesystem passed `git update-index --test-untracked-cache` (see
+# GitClient._status_config). With the untracked cache on, status only
+# re-lists directories whose mtime changed instead of walking the whole tree
+# for untracked files. On filesystems with unreliable directory mtimes
+# (network shares, some sync folders) it would silently miss new files, so
+# there git's default is left alone.
+# core.fsmonitor is left to the user: it needs git >= 2.36 on Windows/macOS
+# (the documented minimum here is 2.20) and a long-running daemon.
+_STATUS_CONFIG = ("-c", "core.untrackedCache=true")
+
+# Every XY pair porcelain v1 can emit, classified once at import so parsing
+# a status record is a single dict lookup rather than a chain of tests.
+_XY_CODES = " MTADRCU?!"
+_STATUS_KIND_BY_XY = {x + y: _classify_xy(x, y) for x in _XY_CODES for y in _XY_CODES}
+
 # Phase G5 / R2.4: default shallow-clone depth offered by the clone UI when
 # a fast cold-start clone is desirable (e.g. a fresh container).
 DEFAULT_SHALLOW_CLONE_DEPTH = 20
@@ -111,7 +243,7 @@ RECOVERY_REF = "refs/heads/gitpdm/recovery"
 PRESENCE_REF = "refs/heads/gitpdm/presence"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileStatus:
     """Structured representation of a porcelain status entry."""
 
@@ -123,7 +255,7 @@ class FileStatus:
     is_untracked: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class CmdResult:
     """Simple command result wrapper."""
 
@@ -133,7 +265,17 @@ class CmdResult:
     error_code: Optional[str] = None
 
 
-@dataclass
+def _no_git_result():
+    """Fresh result for the "git not available" guard failure."""
+    return CmdResult(False, "", "Git not available", "NO_GIT")
+
+
+def _invalid_repo_result():
+    """Fresh result for the "invalid repository" guard failure."""
+    return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+
+
+@dataclass(slots=True)
 class RecoveryCheckpointEntry:
     """One commit on the recovery branch -- see list_recovery_checkpoints()."""
 
@@ -204,6 +346,118 @@ def _find_git_executable():
     return None
 
 
+def _iter_nul_records(stream, chunk_size=65536):
+    """
+    Yield the non-empty NUL-terminated records of a binary stream as str.
+
+    Reads chunk_size bytes at a time, so only one chunk plus a partial
+    record is ever buffered. Decoded as UTF-8: with -z, git writes paths
+    unquoted in UTF-8 regardless of the locale (text=True would use the
+    locale codec, cp1252 on most Windows installs).
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (pending + chunk).split(b"\0")
+        pending = records.pop()
+        for record in records:
+            if record:
+                yield record.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+# Process-wide results of _find_git_executable() and the `git --version`
+# probe. Git's location and version don't change during a FreeCAD session,
+# but GitClient is constructed fresh in several places (services.git_client(),
+# the repo picker, the new-repo wizard, diagnostics), and each instance would
+# otherwise re-probe with its own subprocesses. Only successful probes are
+# cached, so installing git mid-session is still picked up on the next check.
+_cached_git_exe: Optional[str] = None
+_cached_git_version: Optional[str] = None
+
+
+# Repo-root directory checks: nearly every GitClient method starts with
+# _is_dir_cached(repo_root), and a single panel refresh calls a dozen of them
+# on the same path -- each a full stat, which is slow on the network shares
+# PDM repos often live on. Only positive results are kept, for a short TTL:
+# a missing directory is always re-checked, and a deleted one just means git
+# reports the error itself for a couple of seconds.
+_ISDIR_TTL = 2.0
+_isdir_cache: dict = {}
+
+
+def _is_dir_cached(path):
+    """os.path.isdir(path), remembering True results for _ISDIR_TTL seconds."""
+    now = time.monotonic()
+    stamp = _isdir_cache.get(path)
+    if stamp is not None and now - stamp < _ISDIR_TTL:
+        return True
+    if os.path.isdir(path):
+        _isdir_cache[path] = now
+        return True
+    _isdir_cache.pop(path, None)
+    return False
+
+
+# repo_root -> whether its filesystem passed git's untracked-cache test;
+# None while that test is still running. The test takes several seconds
+# (it waits for directory mtimes to tick), so it runs once per repo per
+# session, off the calling thread.
+_untracked_cache_ok: dict = {}
+_untracked_cache_lock = threading.Lock()
+
+
+def _test_untracked_cache(git_cmd, repo_root):
+    """
+    Run `git update-index --test-untracked-cache` for repo_root's filesystem.
+
+    The test creates and deletes scratch directories in the work tree it
+    runs in, so it runs in a throwaway repo under .git/ -- the same
+    filesystem, but nothing a concurrent status or stage-all could see.
+    """
+    git_dir = os.path.join(repo_root, ".git")
+    if not os.path.isdir(git_dir):
+        return False  # worktree/submodule gitfile: not worth resolving
+    try:
+        scratch = tempfile.mkdtemp(prefix="gitpdm-utc-", dir=git_dir)
+    except OSError:
+        return False
+    try:
+        kwargs = dict(capture_output=True, timeout=60, **_get_subprocess_kwargs())
+        init = subprocess.run([git_cmd, "init", "-q", scratch], **kwargs)
+        if init.returncode != 0:
+            return False
+        test = subprocess.run(
+            [git_cmd, "-C", scratch, "update-index", "--test-untracked-cache"],
+            **kwargs,
+        )
+        return test.returncode == 0
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _record_untracked_cache_test(git_cmd, repo_root):
+    ok = _test_untracked_cache(git_cmd, repo_root)
+    with _untracked_cache_lock:
+        _untracked_cache_ok[repo_root] = ok
+    log.debug(f"Untracked cache {'enabled' if ok else 'not used'} for {repo_root}")
+
+
+def _reset_git_probe_cache():
+    """Forget the process-wide git probe results (tests)."""
+    global _cached_git_exe, _cached_git_version
+    _cached_git_exe = None
+    _cached_git_version = None
+    _isdir_cache.clear()
+    with _untracked_cache_lock:
+        _untracked_cache_ok.clear()
+
+
 class GitClient:
     """
     Minimal git client using subprocess calls.
@@ -215,6 +469,17 @@ class GitClient:
         self._git_available = None
         self._git_version = None
         self._git_exe = None
+        # path -> repo root, for get_repo_root(). Revalidated on each hit by
+        # checking the root still has a .git entry; cleared by init/clone.
+        self._repo_root_cache = {}
+        # repo_root -> (.git/config mtime_ns, remote names), for has_remote().
+        # Any remote add/remove/rename rewrites .git/config, so its mtime is
+        # the invalidation key -- including edits made outside GitPDM.
+        self._remotes_cache = {}
+        # repo_root -> (.git/HEAD stat key, branch), for current_branch().
+        # Checkout/switch and detached-HEAD commits all rewrite HEAD (via a
+        # lockfile rename), so its mtime/size/inode is the invalidation key.
+        self._branch_cache = {}
 
     def _get_git_command(self):
         """
@@ -223,8 +488,11 @@ class GitClient:
         Returns:
             str or list: Git command/path
         """
+        global _cached_git_exe
         if self._git_exe is None:
-            self._git_exe = _find_git_executable()
+            if _cached_git_exe is None:
+                _cached_git_exe = _find_git_executable()
+            self._git_exe = _cached_git_exe
         return self._git_exe if self._git_exe else "git"
 
     def is_git_available(self):
@@ -234,9 +502,15 @@ class GitClient:
         Returns:
             bool: True if git command is available
         """
+        global _cached_git_version
         if self._git_available is not None:
             return self._git_available
 
+        if _cached_git_version is not None:
+            self._git_available = True
+            self._git_version = _cached_git_version
+            return True
+
         git_cmd = self._get_git_command()
         if git_cmd is None:
             self._git_available = False
@@ -254,6 +528,7 @@ class GitClient:
             self._git_available = result.returncode == 0
             if self._git_available:
                 self._git_version = result.stdout.strip()
+                _cached_git_version = self._git_version
                 log.info(f"Git available: {self._git_version}")
         except (FileNotFoundError, subprocess.TimeoutExpired):
             self._git_available = False
@@ -292,6 +567,10 @@ class GitClient:
             log.warning(f"Invalid path for repo check: {path}")
             return None
 
+        cached = self._repo_root_cache.get(path)
+        if cached is not None and os.path.exists(os.path.join(cached, ".git")):
+            return cached
+
         git_cmd = self._get_git_command()
 
         try:
@@ -307,6 +586,7 @@ class GitClient:
                 # Normalize path (git returns forward slashes on Windows)
                 repo_root = os.path.normpath(repo_root)
                 log.debug(f"Found repo root: {repo_root}")
+                self._repo_root_cache[path] = repo_root
                 return repo_root
             else:
                 log.warning(
@@ -320,12 +600,15 @@ class GitClient:
 
         return None
 
-    def init_repo(self, path):
+    def init_repo(self, path, initial_branch=None):
         """
         Initialize a new git repository in the given path.
 
         Args:
             path: Directory path where to create the repository (string)
+            initial_branch: Optional name for the unborn branch. Passed as
+                init.defaultBranch (git 2.28+; older git ignores it and
+                set_default_branch() renames afterwards as before)
 
         Returns:
             CmdResult: Result of the init operation
@@ -343,16 +626,21 @@ class GitClient:
             )
 
         git_cmd = self._get_git_command()
+        args = [git_cmd, "-C", path, "init"]
+        if initial_branch:
+            args[1:1] = ["-c", f"init.defaultBranch={initial_branch}"]
 
         try:
             result = subprocess.run(
-                [git_cmd, "-C", path, "init"],
+                args,
                 capture_output=True,
                 text=True,
                 timeout=15,
                 **_get_subprocess_kwargs(),
             )
             if result.returncode == 0:
+                # A new repo can change the answer for any cached path under it.
+                self._repo_root_cache.clear()
                 log.info(f"Repository initialized at: {path}")
                 return CmdResult(ok=True, stdout=result.stdout.strip(), stderr="")
             else:
@@ -395,7 +683,7 @@ class GitClient:
                 ok=False, stdout="", stderr="Git not available", error_code="no_git"
             )
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             log.error(f"Invalid repo root for add_remote: {repo_root}")
             return CmdResult(
                 ok=False,
@@ -426,6 +714,9 @@ class GitClient:
                 **_get_subprocess_kwargs(),
             )
             if result.returncode == 0:
+                # Don't rely on the mtime key alone: a coarse-timestamp
+                # filesystem could leave it unchanged within one tick.
+                self._remotes_cache.pop(repo_root, None)
                 log.info(f"Remote '{name}' added: {url}")
                 return CmdResult(ok=True, stdout=result.stdout.strip(), stderr="")
 
@@ -512,6 +803,7 @@ class GitClient:
                 **_get_subprocess_kwargs(),
             )
             if result.returncode == 0:
+                self._repo_root_cache.clear()
                 log.info(f"Repository cloned to: {dest_abs}")
                 return CmdResult(True, result.stdout.strip(), result.stderr.strip())
 
@@ -538,7 +830,11 @@ class GitClient:
         affordance, never a real git operation, so an unreadable answer
         should not block anything.
         """
-        if not self.is_git_available() or not repo_root or not os.path.isdir(repo_root):
+        if (
+            not self.is_git_available()
+            or not repo_root
+            or not _is_dir_cached(repo_root)
+        ):
             return False
 
         git_cmd = self._get_git_command()
@@ -570,7 +866,7 @@ class GitClient:
         """
         if not self.is_git_available():
             return CmdResult(False, "", "Git not available", error_code="no_git")
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return CmdResult(
                 False, "", "Invalid repository path", error_code="bad_args"
             )
@@ -625,9 +921,26 @@ class GitClient:
         if not self.is_git_available():
             return "(unknown)"
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return "(unknown)"
 
+        try:
+            st = os.stat(os.path.join(repo_root, ".git", "HEAD"))
+            stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            # No plain .git/HEAD (e.g. a worktree's .git file): don't cache.
+            stamp = None
+        cached = self._branch_cache.get(repo_root)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        branch = self._read_current_branch(repo_root)
+        if stamp is not None and branch != "(unknown)":
+            self._branch_cache[repo_root] = (stamp, branch)
+        return branch
+
+    def _read_current_branch(self, repo_root):
+        """Uncached half of current_branch(): ask git."""
         git_cmd = self._get_git_command()
 
         try:
@@ -676,7 +989,7 @@ class GitClient:
             log.warning("Git not available for list_local_branches")
             return []
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             log.warning(f"Invalid repo_root for list_local_branches: {repo_root}")
             return []
 
@@ -725,7 +1038,7 @@ class GitClient:
             log.warning("Git not available for list_remote_branches")
             return []
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             log.warning(f"Invalid repo_root for list_remote_branches: {repo_root}")
             return []
 
@@ -777,7 +1090,7 @@ class GitClient:
                 ok=False, stdout="", stderr="Git not available", error_code="NO_GIT"
             )
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return CmdResult(
                 ok=False,
                 stdout="",
@@ -835,7 +1148,7 @@ class GitClient:
                 ok=False, stdout="", stderr="Git not available", error_code="NO_GIT"
             )
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return CmdResult(
                 ok=False,
                 stdout="",
@@ -913,7 +1226,7 @@ class GitClient:
                 ok=False, stdout="", stderr="Git not available", error_code="NO_GIT"
             )
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return CmdResult(
                 ok=False,
                 stdout="",
@@ -964,7 +1277,7 @@ class GitClient:
         if not self.is_git_available():
             return None
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -1005,31 +1318,27 @@ class GitClient:
 
     def _classify_status_kind(self, x_code, y_code):
         """Classify porcelain XY codes into a status kind."""
-        if x_code == "?" and y_code == "?":
-            return STATUS_UNTRACKED
-
-        if "U" in (x_code, y_code):
-            return STATUS_CONFLICT
-
-        if (x_code == "A" and y_code == "D") or (x_code == "D" and y_code == "A"):
-            return STATUS_CONFLICT
-
-        if "R" in (x_code, y_code):
-            return STATUS_RENAMED
-
-        if "C" in (x_code, y_code):
-            return STATUS_COPIED
-
-        if "D" in (x_code, y_code):
-            return STATUS_DELETED
-
-        if "A" in (x_code, y_code):
-            return STATUS_ADDED
-
-        if "M" in (x_code, y_code) or "T" in (x_code, y_code):
-            return STATUS_MODIFIED
-
-        return STATUS_UNKNOWN
+        kind = _STATUS_KIND_BY_XY.get(x_code + y_code)
+        return kind if kind is not None else _classify_xy(x_code, y_code)
+
+    def _status_config(self, repo_root):
+        """
+        `-c` options for a status call in repo_root: the untracked cache
+        once the repo's filesystem has passed git's own test, nothing (git's
+        default) otherwise. The first call per repo starts that test in the
+        background and uses the default meanwhile.
+        """
+        with _untracked_cache_lock:
+            if repo_root in _untracked_cache_ok:
+                return _STATUS_CONFIG if _untracked_cache_ok[repo_root] else ()
+            _untracked_cache_ok[repo_root] = None
+        threading.Thread(
+            target=_record_untracked_cache_test,
+            args=(self._get_git_command(), repo_root),
+            name="gitpdm-untracked-cache-test",
+            daemon=True,
+        ).start()
+        return ()
 
     def status_porcelain(self, repo_root):
         """
@@ -1046,78 +1355,107 @@ class GitClient:
         if not self.is_git_available():
             return entries
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return entries
 
         git_cmd = self._get_git_command()
 
+        # Streamed: records are parsed as 64 KB chunks arrive instead of
+        # holding the whole output (as bytes, then str, then a token list)
+        # in memory at once -- that's several MB on a big repo. stderr goes
+        # to a temp file so it can never fill a pipe and stall git.
         try:
-            proc_result = subprocess.run(
-                [git_cmd, "-C", repo_root, "status", "--porcelain=v1", "-z"],
-                capture_output=True,
-                text=True,
-                timeout=20,
-                **_get_subprocess_kwargs(),
-            )
-        except subprocess.TimeoutExpired:
-            log.warning("Git status command timed out")
-            return entries
+            stderr_file = tempfile.TemporaryFile()
         except OSError as e:
             log.warning(f"Failed to run git status: {e}")
             return entries
+        with stderr_file:
+            try:
+                proc = subprocess.Popen(
+                    [
+                        git_cmd,
+                        "-C",
+                        repo_root,
+                        *self._status_config(repo_root),
+                        "status",
+                        "--porcelain=v1",
+                        "-z",
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    **_get_subprocess_kwargs(),
+                )
+            except OSError as e:
+                log.warning(f"Failed to run git status: {e}")
+                return entries
 
-        if proc_result.returncode != 0:
-            stderr = proc_result.stderr.strip()
-            log.debug(f"Git status returned {proc_result.returncode}: {stderr}")
-            return entries
-
-        raw = proc_result.stdout
-        if not raw:
-            return entries
-
-        tokens = [t for t in raw.split("\0") if t]
-        idx = 0
-
-        while idx < len(tokens):
-            token = tokens[idx]
-            idx += 1
-
-            if len(token) < 3:
-                continue
-
-            x_code = token[0]
-            y_code = token[1]
-            path_part = token[3:] if len(token) > 3 else ""
+            timed_out = threading.Event()
 
-            rename_target = None
-            if (x_code in ("R", "C") or y_code in ("R", "C")) and (idx < len(tokens)):
-                rename_target = tokens[idx]
-                idx += 1
+            def _kill():
+                timed_out.set()
+                proc.kill()
 
-            display_path = path_part
-            if rename_target:
-                display_path = f"{path_part} -> {rename_target}"
+            watchdog = threading.Timer(20, _kill)
+            watchdog.start()
+            try:
+                with proc.stdout:
+                    tokens = _iter_nul_records(proc.stdout)
+                    for token in tokens:
+                        entry = self._parse_status_record(token, tokens)
+                        if entry is not None:
+                            entries.append(entry)
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                log.warning("Git status command timed out")
+                return []
+            if returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode("utf-8", errors="replace").strip()
+                log.debug(f"Git status returned {returncode}: {stderr}")
+                return []
 
-            kind = self._classify_status_kind(x_code, y_code)
+        return entries
 
-            entry = FileStatus(
-                path=display_path,
-                x=x_code,
-                y=y_code,
-                kind=kind,
-                is_staged=x_code not in (" ", "?"),
-                is_untracked=(x_code == "?" and y_code == "?"),
-            )
-            entries.append(entry)
+    def _parse_status_record(self, token, tokens):
+        """One `status --porcelain=v1 -z` record -> FileStatus (or None)."""
+        if len(token) < 3:
+            return None
 
-        return entries
+        x_code = token[0]
+        y_code = token[1]
+        path_part = token[3:] if len(token) > 3 else ""
+
+        # With -z a rename/copy is "XY <new>\0<orig>\0": the original
+        # path comes *after* the new one (reversed from the non -z form).
+        rename_source = None
+        if x_code in ("R", "C") or y_code in ("R", "C"):
+            rename_source = next(tokens, None)
+
+        display_path = path_part
+        if rename_source:
+            display_path = f"{rename_source} -> {path_part}"
+
+        return FileStatus(
+            path=display_path,
+            x=x_code,
+            y=y_code,
+            kind=self._classify_status_kind(x_code, y_code),
+            is_staged=x_code not in (" ", "?"),
+            is_untracked=(x_code == "?" and y_code == "?"),
+        )
 
-    def status_summary(self, repo_root):
+    def status_summary(self, repo_root, statuses=None):
         """
         Get a summary of the working tree status.
 
         Args:
             repo_root: Repository root path (string)
+            statuses: list[FileStatus] | None - entries already returned by
+                status_porcelain() for this repo; summarized as-is instead of
+                running `git status` a second time
 
         Returns:
             dict with keys:
@@ -1139,7 +1477,8 @@ class GitClient:
             "raw_lines": [],
         }
 
-        statuses = self.status_porcelain(repo_root)
+        if statuses is None:
+            statuses = self.status_porcelain(repo_root)
 
         if not statuses:
             return result
@@ -1177,9 +1516,18 @@ class GitClient:
         if not self.is_git_available():
             return False
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return False
 
+        try:
+            stamp = os.stat(os.path.join(repo_root, ".git", "config")).st_mtime_ns
+        except OSError:
+            # No plain .git/config (e.g. a worktree's .git file): don't cache.
+            stamp = None
+        cached = self._remotes_cache.get(repo_root)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return remote in cached[1]
+
         git_cmd = self._get_git_command()
 
         try:
@@ -1191,7 +1539,9 @@ class GitClient:
                 **_get_subprocess_kwargs(),
             )
             if result.returncode == 0:
-                remotes = result.stdout.strip().split("\n")
+                remotes = frozenset(result.stdout.strip().split("\n"))
+                if stamp is not None:
+                    self._remotes_cache[repo_root] = (stamp, remotes)
                 return remote in remotes
         except (subprocess.TimeoutExpired, OSError) as e:
             log.warning(f"Failed to list remotes: {e}")
@@ -1245,7 +1595,7 @@ class GitClient:
         if not self.is_git_available():
             return Result.failure("GIT_NOT_AVAILABLE", "Git not available")
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return Result.failure("INVALID_REPO_PATH", "Invalid repository path")
 
         git_cmd = self._get_git_command()
@@ -1300,7 +1650,7 @@ class GitClient:
         if not self.is_git_available():
             return None
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -1375,26 +1725,63 @@ class GitClient:
                 - error: str | None
                 - upstream: str | None (the upstream ref used, or None if no tracking)
         """
-        # Try to get the tracking upstream first
-        upstream_ref = self.get_upstream_ref(repo_root)
+        result = {
+            "ahead": 0,
+            "behind": 0,
+            "ok": False,
+            "error": "No upstream configured",
+            "upstream": None,
+        }
+        if not self.is_git_available():
+            result["error"] = "Git not available"
+            return result
+        if not repo_root or not _is_dir_cached(repo_root):
+            result["error"] = "Invalid repository path"
+            return result
 
-        if upstream_ref:
-            # Use the tracking upstream
-            log.debug(f"Using tracking upstream: {upstream_ref}")
-            result = self.ahead_behind(repo_root, upstream_ref)
-            result["upstream"] = upstream_ref
+        # One for-each-ref reports the checked-out branch's upstream name and
+        # its ahead/behind counts together (%(upstream:track) is the same
+        # count rev-list --left-right would give), instead of a rev-parse
+        # @{u} plus a rev-list per refresh.
+        git_cmd = self._get_git_command()
+        proc = self._run_command(
+            [
+                git_cmd,
+                "-C",
+                repo_root,
+                "for-each-ref",
+                "--format=%(HEAD)%00%(upstream:short)%00%(upstream:track,nobracket)",
+                "refs/heads/",
+            ],
+            timeout=15,
+        )
+        if not proc.ok:
+            result["error"] = f"Git for-each-ref failed: {proc.stderr}"
+            return result
+
+        for line in proc.stdout.splitlines():
+            head, _, rest = line.partition("\0")
+            if head != "*":
+                continue
+            upstream_ref, _, track = rest.partition("\0")
+            # "gone": configured, but the remote-tracking ref no longer
+            # exists -- same as @{u} failing to resolve.
+            if not upstream_ref or track == "gone":
+                break
+            for part in track.split(","):
+                word, _, count = part.strip().partition(" ")
+                if word in ("ahead", "behind") and count.isdigit():
+                    result[word] = int(count)
+            log.debug(
+                f"Using tracking upstream: {upstream_ref} "
+                f"({result['ahead']}/{result['behind']})"
+            )
+            result.update(ok=True, error=None, upstream=upstream_ref)
             return result
-        else:
-            # No tracking upstream - return empty result
-            # The UI will show "(not set)" for upstream
-            log.debug("No tracking upstream found")
-            return {
-                "ahead": 0,
-                "behind": 0,
-                "ok": False,
-                "error": "No upstream configured",
-                "upstream": None,
-            }
+
+        # No tracking upstream - the UI will show "(not set)" for upstream
+        log.debug("No tracking upstream found")
+        return result
 
     def ahead_behind(self, repo_root, upstream):
         """
@@ -1423,7 +1810,7 @@ class GitClient:
             result["error"] = "Git not available"
             return result
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             result["error"] = "Invalid repository path"
             return result
 
@@ -1554,7 +1941,7 @@ class GitClient:
         """
         if not self.is_git_available():
             return None
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -1583,7 +1970,7 @@ class GitClient:
         """
         if not self.is_git_available():
             return None
-        if not repo_root or not os.path.isdir(repo_root) or not sha:
+        if not repo_root or not _is_dir_cached(repo_root) or not sha:
             return None
 
         git_cmd = self._get_git_command()
@@ -1615,9 +2002,9 @@ class GitClient:
         Returns a CmdResult; on success, `.stdout` holds the new commit SHA.
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         head_sha = self.rev_parse(repo_root, "HEAD")
         if not head_sha:
@@ -1713,9 +2100,9 @@ class GitClient:
         the mainline `push()` above is unaffected and unused here.
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         cred_args = _headless_credential_args()
@@ -1744,9 +2131,9 @@ class GitClient:
         already used around branch switching (see CLAUDE.md).
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
         if not recovery_sha:
             return CmdResult(
                 False, "", "No recovery snapshot to restore", "NO_RECOVERY_SHA"
@@ -1783,9 +2170,9 @@ class GitClient:
         files are modified).
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
         if not recovery_sha:
             return CmdResult(
                 False, "", "No recovery snapshot to export", "NO_RECOVERY_SHA"
@@ -1842,7 +2229,7 @@ class GitClient:
         """
         if not self.is_git_available():
             return []
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return []
 
         git_cmd = self._get_git_command()
@@ -1889,9 +2276,9 @@ class GitClient:
         working tree.
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         # branch_ref is already the full ref (e.g. refs/heads/gitpdm/recovery
@@ -1930,7 +2317,7 @@ class GitClient:
         return its SHA, or None on failure."""
         if not self.is_git_available():
             return None
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -1946,7 +2333,7 @@ class GitClient:
         `blob_sha`) and return the tree's SHA, or None on failure."""
         if not self.is_git_available():
             return None
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -1963,9 +2350,9 @@ class GitClient:
         branch's first-ever commit, unlike commit_recovery_checkpoint which
         always has HEAD to fall back on)."""
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         args = [git_cmd, "-C", repo_root, "commit-tree", tree_sha]
@@ -1980,9 +2367,9 @@ class GitClient:
         fails loudly if `ref` no longer points at `expected_old_sha` (someone
         else updated it first) rather than clobbering their write."""
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         args = [git_cmd, "-C", repo_root, "update-ref", ref, new_sha]
@@ -1998,7 +2385,7 @@ class GitClient:
         but not a byte-exact file read."""
         if not self.is_git_available():
             return None
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             return None
 
         git_cmd = self._get_git_command()
@@ -2015,9 +2402,9 @@ class GitClient:
         errors) -- callers should treat a failed fetch as "proceed with
         whatever's local" rather than surfacing it."""
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+            return _no_git_result()
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         cred_args = _headless_credential_args()
@@ -2037,54 +2424,19 @@ class GitClient:
 
     def _classify_commit_error(self, stderr_text):
         """Map commit stderr output to a friendly code."""
-        lower = stderr_text.lower()
-
-        if "nothing to commit" in lower:
-            return "NOTHING_TO_COMMIT"
-        if "no changes added to commit" in lower:
-            return "NOTHING_TO_COMMIT"
-        if "user.name" in lower or "user.email" in lower:
-            return "MISSING_IDENTITY"
-        if "please tell me who you are" in lower:
-            return "MISSING_IDENTITY"
-
-        return "UNKNOWN_ERROR"
+        return _match_error_code(_COMMIT_ERROR_PATTERNS, stderr_text)
 
     def _classify_push_error(self, stderr_text):
         """Map push stderr output to a friendly code."""
-        lower = stderr_text.lower()
-
-        if "authentication failed" in lower:
-            return "AUTH_OR_PERMISSION"
-        if "permission denied" in lower:
-            return "AUTH_OR_PERMISSION"
-        if "could not read from remote repository" in lower:
-            return "AUTH_OR_PERMISSION"
-
-        if "no configured push destination" in lower:
-            return "NO_UPSTREAM"
-        if "no upstream" in lower:
-            return "NO_UPSTREAM"
-        if "set the remote as upstream" in lower:
-            return "NO_UPSTREAM"
-
-        if "does not appear to be a git repository" in lower:
-            return "NO_REMOTE"
-        if "no such remote" in lower:
-            return "NO_REMOTE"
-
-        if "rejected" in lower or "failed to push" in lower:
-            return "REJECTED"
-
-        return "UNKNOWN_ERROR"
+        return _match_error_code(_PUSH_ERROR_PATTERNS, stderr_text)
 
     def stage_all(self, repo_root):
         """Stage all changes (git add -A)."""
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         return self._run_command(
@@ -2098,10 +2450,10 @@ class GitClient:
             return CmdResult(True, "", "", None)
 
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         args = [git_cmd, "-C", repo_root, "add", "--"]
@@ -2127,10 +2479,10 @@ class GitClient:
             log.debug("Commit message was sanitized (removed unsafe characters)")
 
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
         # Use sanitized message
@@ -2154,10 +2506,10 @@ class GitClient:
     def push(self, repo_root, remote="origin"):
         """Push current branch, setting upstream if needed."""
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         git_cmd = self._get_git_command()
 
@@ -2175,9 +2527,39 @@ class GitClient:
         return result
 
     def has_uncommitted_changes(self, repo_root):
-        """Return True if porcelain status reports any entries."""
-        statuses = self.status_porcelain(repo_root)
-        return len(statuses) > 0
+        """
+        Return True if porcelain status reports any entries.
+
+        Yes/no only, so it skips what status_porcelain() pays for the file
+        list: --no-renames drops git's rename detection, and the output is
+        checked for emptiness without being decoded or parsed.
+        """
+        if not self.is_git_available():
+            return False
+        if not repo_root or not _is_dir_cached(repo_root):
+            return False
+
+        git_cmd = self._get_git_command()
+        try:
+            proc = subprocess.run(
+                [
+                    git_cmd,
+                    "-C",
+                    repo_root,
+                    *self._status_config(repo_root),
+                    "status",
+                    "--porcelain=v1",
+                    "-z",
+                    "--no-renames",
+                ],
+                capture_output=True,
+                timeout=20,
+                **_get_subprocess_kwargs(),
+            )
+        except (subprocess.TimeoutExpired, OSError) as e:
+            log.warning(f"Failed to run git status: {e}")
+            return False
+        return proc.returncode == 0 and bool(proc.stdout)
 
     def pull_ff_only(self, repo_root, remote="origin", upstream=None):
         """
@@ -2211,7 +2593,7 @@ class GitClient:
             result["error_code"] = "NO_GIT"
             return result
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             result["error_code"] = "INVALID_REPO"
             return result
 
@@ -2290,42 +2672,7 @@ class GitClient:
         Returns:
             str: Error code category
         """
-        stderr_lower = stderr.lower()
-
-        # Check for dirty working tree
-        if "working tree" in stderr_lower and "dirty" in stderr_lower:
-            return "WORKING_TREE_DIRTY"
-        if "please commit your changes" in stderr_lower:
-            return "WORKING_TREE_DIRTY"
-        if "local changes" in stderr_lower:
-            return "WORKING_TREE_DIRTY"
-
-        # Check for diverged/non-ff history
-        if "not possible to fast-forward" in stderr_lower:
-            return "DIVERGED_OR_NON_FF"
-        if "commit before merging" in stderr_lower:
-            return "DIVERGED_OR_NON_FF"
-        if "conflict" in stderr_lower:
-            return "DIVERGED_OR_NON_FF"
-
-        # Check for authentication/permission issues
-        if "authentication failed" in stderr_lower:
-            return "AUTH_OR_PERMISSION"
-        if "permission denied" in stderr_lower:
-            return "AUTH_OR_PERMISSION"
-        if "fatal: could not read" in stderr_lower:
-            return "AUTH_OR_PERMISSION"
-
-        # Check for no remote
-        if "no such remote" in stderr_lower:
-            return "NO_REMOTE"
-        if "not a git repository" in stderr_lower:
-            return "NO_REMOTE"
-        if "does not appear to be a git repository" in stderr_lower:
-            return "NO_REMOTE"
-
-        # Unknown error
-        return "UNKNOWN_ERROR"
+        return _match_error_code(_PULL_ERROR_PATTERNS, stderr)
 
     # --- Sprint 5: Repo file listing ---
 
@@ -2345,7 +2692,7 @@ class GitClient:
             log.warning("Git not available for ls-files")
             return files
 
-        if not repo_root or not os.path.isdir(repo_root):
+        if not repo_root or not _is_dir_cached(repo_root):
             log.warning("Invalid repository path for ls-files")
             return files
 
@@ -2442,15 +2789,24 @@ class GitClient:
             CmdResult indicating success/failure
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
-        if not repo_root or not os.path.isdir(repo_root):
-            return CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+        if not repo_root or not _is_dir_cached(repo_root):
+            return _invalid_repo_result()
 
         branch = (branch or "main").strip()
         if not branch:
             branch = "main"
 
+        # Already on it (e.g. init_repo(initial_branch=...) on git 2.28+):
+        # nothing to rename, so skip the subprocess.
+        try:
+            with open(os.path.join(repo_root, ".git", "HEAD"), encoding="utf-8") as f:
+                if f.read().strip() == f"ref: refs/heads/{branch}":
+                    return CmdResult(True, "", "", None)
+        except (OSError, UnicodeDecodeError):
+            pass
+
         git_cmd = self._get_git_command()
         return self._run_command(
             [git_cmd, "-C", repo_root, "branch", "-M", branch],
@@ -2487,7 +2843,7 @@ class GitClient:
                 capture_output=True,
                 text=True,
                 timeout=10,
-                cwd=repo_root if repo_root and os.path.isdir(repo_root) else None,
+                cwd=repo_root if repo_root and _is_dir_cached(repo_root) else None,
                 **_get_subprocess_kwargs(),
             )
             if result.returncode == 0:
@@ -2511,7 +2867,7 @@ class GitClient:
             CmdResult indicating success/failure
         """
         if not self.is_git_available():
-            return CmdResult(False, "", "Git not available", "NO_GIT")
+            return _no_git_result()
 
         if not key or not value:
             return CmdResult(False, "", "Missing key or value", "INVALID_ARGS")
@@ -13,38 +13,39 @@ provider conditionals out of `core/`, `export/`, and `ui/`.
 
 from __future__ import annotations
 
+import importlib
 from typing import Dict, List, Type
 
 from freecad_gitpdm.providers.base import BaseProvider, GenericProvider
 
 DEFAULT_PROVIDER_ID = "github"
 
-_REGISTRY: Dict[str, Type[BaseProvider]] = {}
+# id -> (module, class name). Resolved one provider at a time on first
+# lookup, so asking for the repo's own provider (a single id on every
+# git push/pull) doesn't import the other four provider packages too.
+_PROVIDER_MODULES: Dict[str, tuple] = {
+    "github": ("freecad_gitpdm.providers.github.provider", "GitHubProvider"),
+    "gitlab": ("freecad_gitpdm.providers.gitlab.provider", "GitLabProvider"),
+    "gitea": ("freecad_gitpdm.providers.gitea.provider", "GiteaProvider"),
+    "bitbucket": ("freecad_gitpdm.providers.bitbucket.provider", "BitbucketProvider"),
+    "sourcehut": ("freecad_gitpdm.providers.sourcehut.provider", "SourceHutProvider"),
+}
 
-
-def _populate_registry() -> Dict[str, Type[BaseProvider]]:
-    from freecad_gitpdm.providers.github.provider import GitHubProvider
-    from freecad_gitpdm.providers.gitlab import GitLabProvider
-    from freecad_gitpdm.providers.gitea import GiteaProvider
-    from freecad_gitpdm.providers.bitbucket import BitbucketProvider
-    from freecad_gitpdm.providers.sourcehut import SourceHutProvider
-
-    return {
-        "generic": GenericProvider,
-        "github": GitHubProvider,
-        "gitlab": GitLabProvider,
-        "gitea": GiteaProvider,
-        "bitbucket": BitbucketProvider,
-        "sourcehut": SourceHutProvider,
-    }
+_REGISTRY: Dict[str, Type[BaseProvider]] = {"generic": GenericProvider}
 
 
 def get_provider_class(provider_id: str) -> Type[BaseProvider]:
     """Look up a provider class by id. Unknown ids fall back to GenericProvider."""
-    global _REGISTRY
-    if not _REGISTRY:
-        _REGISTRY = _populate_registry()
-    return _REGISTRY.get((provider_id or "").strip().lower(), GenericProvider)
+    key = (provider_id or "").strip().lower()
+    cls = _REGISTRY.get(key)
+    if cls is None:
+        target = _PROVIDER_MODULES.get(key)
+        if target is None:
+            return GenericProvider
+        module_name, class_name = target
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _REGISTRY[key] = cls
+    return cls
 
 
 def get_provider(provider_id: str) -> BaseProvider:
@@ -53,7 +54,4 @@ def get_provider(provider_id: str) -> BaseProvider:
 
 
 def list_provider_ids() -> List[str]:
-    global _REGISTRY
-    if not _REGISTRY:
-        _REGISTRY = _populate_registry()
-    return sorted(_REGISTRY.keys())
+    return sorted(["generic", *_PROVIDER_MODULES])
@@ -59,7 +59,11 @@ class BranchOperationsHandler:
         if not self._parent._current_repo_root:
             return
 
-        if self._is_switching_branch or self._job_runner.is_busy():
+        if (
+            self._is_switching_branch
+            or self._job_runner.is_busy()
+            or self._parent._is_publishing
+        ):
             log.debug("Job running, new branch ignored")
             return
 
@@ -407,6 +411,7 @@ class BranchOperationsHandler:
             or self._is_switching_branch
             or self._is_loading_branches  # Sprint PERF-3: Include branch loading
             or self._job_runner.is_busy()
+            or self._parent._is_publishing
         )
 
         log.debug(
@@ -467,7 +472,11 @@ class BranchOperationsHandler:
         if not self._parent._current_repo_root:
             return
 
-        if self._is_switching_branch or self._job_runner.is_busy():
+        if (
+            self._is_switching_branch
+            or self._job_runner.is_busy()
+            or self._parent._is_publishing
+        ):
             log.debug("Job running, branch switch ignored")
             return
 
@@ -10,9 +10,18 @@ Sprint 4: Extracted from panel.py to manage commit and push operations.
 # code doesn't need updating on the next Qt major-version bump.
 from PySide import QtCore, QtWidgets
 
+import re
+
 from freecad_gitpdm.core import log, checkpoint
 from freecad_gitpdm.ui import dialogs
 
+# git's "upstream branch ... does not match the name of your current branch"
+# push refusal; matched against raw stderr, in either phrase order.
+_UPSTREAM_MISMATCH_RE = re.compile(
+    r"upstream branch.*does not match|does not match.*upstream branch",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class CommitPushHandler:
     """
@@ -61,7 +70,11 @@ class CommitPushHandler:
             log.warning("No repository to commit")
             return
 
-        if self._is_committing or self._job_runner.is_busy():
+        if (
+            self._is_committing
+            or self._job_runner.is_busy()
+            or self._parent._is_publishing
+        ):
             log.debug("Job running, commit ignored")
             return
 
@@ -108,7 +121,11 @@ class CommitPushHandler:
             log.warning("No repository to push")
             return
 
-        if self._is_pushing or self._job_runner.is_busy():
+        if (
+            self._is_pushing
+            or self._job_runner.is_busy()
+            or self._parent._is_publishing
+        ):
             log.debug("Job running, push ignored")
             return
 
@@ -155,7 +172,12 @@ class CommitPushHandler:
             log.warning("No repository to commit+push")
             return
 
-        if self._is_committing or self._is_pushing or self._job_runner.is_busy():
+        if (
+            self._is_committing
+            or self._is_pushing
+            or self._job_runner.is_busy()
+            or self._parent._is_publishing
+        ):
             log.debug("Job running, commit+push ignored")
             return
 
@@ -336,10 +358,7 @@ class CommitPushHandler:
 
         if not success:
             # Check for upstream mismatch error
-            if (
-                "upstream branch" in stderr.lower()
-                and "does not match" in stderr.lower()
-            ):
+            if _UPSTREAM_MISMATCH_RE.search(stderr):
                 # Upstream mismatch - offer to use current branch name
                 reply = QtWidgets.QMessageBox.question(
                     self._parent,
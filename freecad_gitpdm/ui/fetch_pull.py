@@ -10,11 +10,16 @@ Sprint 4: Extracted from panel.py to manage fetch and pull operations.
 # code doesn't need updating on the next Qt major-version bump.
 from PySide import QtCore, QtWidgets
 
+import re
 from datetime import datetime, timezone
 
 from freecad_gitpdm.core import log, settings
 from freecad_gitpdm.ui import dialogs
 
+# Matched against raw stderr (case-insensitive), no lowercased copy needed.
+_NETWORK_ERROR_RE = re.compile(r"could not resolve host", re.IGNORECASE)
+_PERMISSION_ERROR_RE = re.compile(r"permission denied", re.IGNORECASE)
+
 
 class FetchPullHandler:
     """
@@ -200,9 +205,9 @@ class FetchPullHandler:
             exit_code = result.get("exit_code", -1)
 
             # Create user-friendly error message
-            if "could not resolve host" in stderr.lower():
+            if _NETWORK_ERROR_RE.search(stderr):
                 error_msg = "Fetch failed: Network error"
-            elif "permission denied" in stderr.lower():
+            elif _PERMISSION_ERROR_RE.search(stderr):
                 error_msg = "Fetch failed: Permission denied"
             elif exit_code == -1:
                 error_msg = "Fetch failed: Process error"
@@ -32,7 +32,7 @@ import os
 import re
 from typing import Optional, Callable
 
-from freecad_gitpdm.core import log, scaffold, provider_config
+from freecad_gitpdm.core import jobs, log, scaffold, provider_config
 from freecad_gitpdm.providers.base import BaseProvider, GenericProvider, RemoteRepoInfo
 from freecad_gitpdm.providers.github.api_client import GitHubApiClient
 from freecad_gitpdm.providers.github.errors import GitHubApiError
@@ -88,6 +88,9 @@ class NewRepoWizard(QtWidgets.QWizard):
         # Results
         self._created_repo_path = None
         self._created_repo_name = None
+        # True while the progress page's push runs on a worker; the wizard
+        # has to stay open until it reports back (see reject()).
+        self._push_in_flight = False
 
         # Hook finish
         self.finished.connect(self._on_finished)
@@ -105,6 +108,18 @@ class NewRepoWizard(QtWidgets.QWizard):
         # Just proceed with normal wizard acceptance
         super().accept()
 
+    def reject(self):
+        """Ignore Cancel/Esc/window-close while the push is running.
+
+        The push can't be stopped once started, and its callback is what
+        records the created repo. Closing the wizard first would report a
+        cancel to the caller and lose a repo that was created and pushed.
+        """
+        if self._push_in_flight:
+            log.debug("New repo wizard close ignored: push still running")
+            return
+        super().reject()
+
     def get_created_repo_path(self) -> Optional[str]:
         """Return local path of created repo, or None if failed."""
         return self._created_repo_path
@@ -748,7 +763,7 @@ class _ProgressPage(QtWidgets.QWizardPage):
                 self._show_recovery(folder_abs, repo_info.html_url)
                 return
 
-            init_result = git_client.init_repo(folder_abs)
+            init_result = git_client.init_repo(folder_abs, initial_branch="main")
             log.info(
                 f"Git init result: ok={init_result.ok}, stderr={init_result.stderr}"
             )
@@ -839,50 +854,21 @@ class _ProgressPage(QtWidgets.QWizardPage):
             self._update_step_success(self._step_index, "Origin remote added")
 
             # === Push ===
+            # The only step that can sit on the network for a long time (a
+            # slow or stalled remote holds it for git's full timeout), so it
+            # runs on a worker and the wizard keeps repainting meanwhile.
             self._add_step("Pushing to remote…")
             log.info("Pushing to remote")
-            push_result = git_client.push(folder_abs, "origin")
-            if not push_result.ok:
-                if "AUTH_OR_PERMISSION" in (push_result.error_code or ""):
-                    msg = (
-                        "Authentication failed.\n\n"
-                        "Ensure Git Credential Manager is configured and "
-                        "you're signed into GitHub Desktop or the credential prompt."
-                    )
-                    log.error("Push failed - auth error")
-                    self._update_step_error(self._step_index, msg)
-                else:
-                    log.error(f"Push failed: {push_result.stderr}")
-                    self._update_step_error(
-                        self._step_index, f"Push failed: {push_result.stderr}"
-                    )
-                return
-            log.info("Push successful")
-            self._update_step_success(self._step_index, "Pushed successfully")
-
-            # === SUCCESS ===
-            log.info("=== run_workflow COMPLETE - SUCCESS ===")
-            self._parent_wizard._created_repo_path = folder_abs
-            self._parent_wizard._created_repo_name = repo_info.full_name
-            html_link = (
-                f"<a href='{repo_info.html_url}'>View repository</a>"
-                if repo_info.html_url
-                else ""
+            self._parent_wizard.button(QtWidgets.QWizard.CancelButton).setEnabled(False)
+            self._parent_wizard._push_in_flight = True
+            jobs.get_job_runner().run_callable(
+                "new_repo_push",
+                lambda: git_client.push(folder_abs, "origin"),
+                on_success=lambda result: self._on_push_finished(
+                    result, folder_abs, repo_info
+                ),
+                on_error=self._on_push_error,
             )
-            self._result_label.setText(
-                f"✓ Success!\n\n"
-                f"Repository: {repo_info.full_name}\n"
-                f"Local folder: {folder_abs}\n\n"
-                f"{html_link}"
-            )
-            self._result_label.setStyleSheet(
-                "background: #e8f5e9; padding: 8px; border-radius: 4px; color: green;"
-            )
-
-            # Allow finishing
-            self.setFinalPage(True)
-            self._parent_wizard.button(QtWidgets.QWizard.FinishButton).setEnabled(True)
-            self._parent_wizard.button(QtWidgets.QWizard.BackButton).setEnabled(True)
 
         except _PROVIDER_API_ERRORS as e:
             log.error(f"Provider API error: {e}")
@@ -893,6 +879,59 @@ class _ProgressPage(QtWidgets.QWizardPage):
             self._add_step_error(-1, str(e))
             self._parent_wizard.button(QtWidgets.QWizard.BackButton).setEnabled(True)
 
+    def _on_push_finished(self, push_result, folder_abs, repo_info):
+        """UI-thread tail of run_workflow() once the worker's push returns."""
+        self._parent_wizard._push_in_flight = False
+        self._parent_wizard.button(QtWidgets.QWizard.CancelButton).setEnabled(True)
+        if not push_result.ok:
+            if "AUTH_OR_PERMISSION" in (push_result.error_code or ""):
+                msg = (
+                    "Authentication failed.\n\n"
+                    "Ensure Git Credential Manager is configured and "
+                    "you're signed into GitHub Desktop or the credential prompt."
+                )
+                log.error("Push failed - auth error")
+                self._update_step_error(self._step_index, msg)
+            else:
+                log.error(f"Push failed: {push_result.stderr}")
+                self._update_step_error(
+                    self._step_index, f"Push failed: {push_result.stderr}"
+                )
+            return
+        log.info("Push successful")
+        self._update_step_success(self._step_index, "Pushed successfully")
+
+        # === SUCCESS ===
+        log.info("=== run_workflow COMPLETE - SUCCESS ===")
+        self._parent_wizard._created_repo_path = folder_abs
+        self._parent_wizard._created_repo_name = repo_info.full_name
+        html_link = (
+            f"<a href='{repo_info.html_url}'>View repository</a>"
+            if repo_info.html_url
+            else ""
+        )
+        self._result_label.setText(
+            f"✓ Success!\n\n"
+            f"Repository: {repo_info.full_name}\n"
+            f"Local folder: {folder_abs}\n\n"
+            f"{html_link}"
+        )
+        self._result_label.setStyleSheet(
+            "background: #e8f5e9; padding: 8px; border-radius: 4px; color: green;"
+        )
+
+        # Allow finishing
+        self.setFinalPage(True)
+        self._parent_wizard.button(QtWidgets.QWizard.FinishButton).setEnabled(True)
+        self._parent_wizard.button(QtWidgets.QWizard.BackButton).setEnabled(True)
+
+    def _on_push_error(self, error):
+        self._parent_wizard._push_in_flight = False
+        self._parent_wizard.button(QtWidgets.QWizard.CancelButton).setEnabled(True)
+        log.error(f"Push failed with exception: {type(error).__name__}: {error}")
+        self._add_step_error(-1, str(error))
+        self._parent_wizard.button(QtWidgets.QWizard.BackButton).setEnabled(True)
+
     def _add_step(self, message: str):
         """Add a new step to the progress list (in progress state)."""
         item = QtWidgets.QListWidgetItem(message)
@@ -15,6 +15,7 @@ import glob
 import sys
 import subprocess
 import time
+from datetime import datetime, timezone
 
 from freecad_gitpdm.core import (
     log,
@@ -294,6 +295,10 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         self._is_updating_upstream = (
             False  # Sprint PERF-1: prevent concurrent upstream updates
         )
+        # Set while Publish's stage/commit/push runs on a worker thread.
+        # run_callable jobs are invisible to JobRunner.is_busy(), so every
+        # "is a git operation running" gate checks this flag as well.
+        self._is_publishing = False
         self._doc_observer = None
         # Repo-relative paths we've announced as open on the presence branch
         # this session (Plan A) -- drives what the heartbeat tick refreshes
@@ -500,12 +505,14 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
             # process exits before this finishes, our entry just ages out
             # via STALE_PRESENCE_SECONDS -- the same graceful degradation as
             # a crash, which is the correct advisory behavior either way.
+            # One batched close (one commit, one push) for every open file.
             repo_root = self._current_repo_root
-            for rel_path in list(self._presence_open_files):
+            rel_paths = sorted(self._presence_open_files)
+            if rel_paths:
                 self._job_runner.run_callable(
-                    f"presence-close-{rel_path}",
-                    lambda rp=rel_path: presence.announce_close(
-                        self._git_client, repo_root, rp
+                    "presence-close-all",
+                    lambda: presence.announce_close_files(
+                        self._git_client, repo_root, rel_paths
                     ),
                 )
 
@@ -529,11 +536,16 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         except Exception as e:
             log.debug(f"Failed to refresh session lock: {e}")
 
+        # All open files in one presence commit/push rather than one job
+        # per file, which also kept those jobs racing each other's CAS.
         repo_root = self._current_repo_root
-        for rel_path in list(self._presence_open_files):
+        rel_paths = sorted(self._presence_open_files)
+        if rel_paths:
             self._job_runner.run_callable(
-                f"presence-heartbeat-{rel_path}",
-                lambda rp=rel_path: presence.heartbeat(self._git_client, repo_root, rp),
+                "presence-heartbeat",
+                lambda: presence.heartbeat_files(
+                    self._git_client, repo_root, rel_paths
+                ),
             )
 
     def _presence_rel_path_for(self, filename):
@@ -874,8 +886,6 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
                     )
                     return
 
-                from datetime import datetime, timezone
-
                 settings.save_last_preview_at(datetime.now(timezone.utc).isoformat())
                 if result.rel_dir:
                     settings.save_last_preview_dir(result.rel_dir)
@@ -1902,6 +1912,7 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
             self._fetch_pull.is_busy()
             or self._commit_push.is_busy()
             or self._job_runner.is_busy()
+            or self._is_publishing
         )
 
         if hasattr(self, "commit_message"):
@@ -2320,6 +2331,7 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
                 self._fetch_pull.is_busy()
                 or self._commit_push.is_busy()
                 or self._job_runner.is_busy()
+                or self._is_publishing
                 or self._active_operations  # Check tracked operations
                 or self._branch_ops._is_switching_branch
                 or self._branch_ops._is_loading_branches
@@ -2372,8 +2384,9 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
 
         # Run git status operations in background
         def _fetch_status():
-            status = self._git_client.status_summary(repo_root)
+            # One `git status` run serves both the summary and the file list.
             file_statuses = self._git_client.status_porcelain(repo_root)
+            status = self._git_client.status_summary(repo_root, file_statuses)
             return {"status": status, "file_statuses": file_statuses}
 
         self._job_runner.run_callable(
@@ -2533,8 +2546,6 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         rel_dir = settings.load_last_preview_dir()
         if ts:
             try:
-                from datetime import datetime
-
                 dt = datetime.fromisoformat(ts)
                 display = dt.strftime("%Y-%m-%d %H:%M:%S")
             except Exception:
@@ -2599,8 +2610,6 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
             return
 
         # Update status labels and remember last output dir
-        from datetime import datetime, timezone
-
         settings.save_last_preview_at(datetime.now(timezone.utc).isoformat())
         if result.rel_dir:
             settings.save_last_preview_dir(result.rel_dir)
@@ -2653,7 +2662,7 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
             return
 
         # Check if busy
-        if self._job_runner.is_busy():
+        if self._job_runner.is_busy() or self._is_publishing:
             log.debug("Job running, publish ignored")
             return
 
@@ -2750,31 +2759,48 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         if result.details:
             export_result = result.details.get("export_result")
 
-        # Step 3: Stage files
-        progress.setLabelText("Staging files…")
+        # Steps 3-5: stage, commit, push. Git-only, so they run on a worker
+        # thread -- the push's network wait no longer freezes the GUI.
+        # No Cancel from here on: the worker can't be stopped mid-push, so
+        # dismissing the dialog would only hide a push that keeps running.
+        progress.setCancelButton(None)
+        progress.setLabelText("Staging, committing and pushing…")
         progress.setValue(2)
         QtWidgets.QApplication.processEvents()
 
         source_path = precheck_details.get("file_name") if precheck_details else None
-        result = coordinator.stage_files(
-            self._current_repo_root,
-            source_path,
-            export_result,
-            stage_all=self.stage_all_checkbox.isChecked(),
+        stage_all = self.stage_all_checkbox.isChecked()
+        repo_root = self._current_repo_root
+
+        def _publish_git():
+            return coordinator.stage_commit_push(
+                repo_root, source_path, export_result, commit_message, stage_all
+            )
+
+        def _publish_git_failed(error):
+            self._on_publish_git_finished(
+                progress,
+                publish.PublishResult(
+                    ok=False, step=coordinator.current_step, message=str(error)
+                ),
+            )
+
+        self._is_publishing = True
+        self._update_button_states_fast()
+        self._job_runner.run_callable(
+            "publish_git",
+            _publish_git,
+            on_success=lambda result: self._on_publish_git_finished(progress, result),
+            on_error=_publish_git_failed,
         )
-        if not result.ok:
-            progress.close()
-            self._handle_publish_error(result)
-            return
 
-        # Step 4: Commit
-        progress.setLabelText("Creating commit…")
-        progress.setValue(3)
-        QtWidgets.QApplication.processEvents()
+    def _on_publish_git_finished(self, progress, result):
+        """UI-thread tail of the publish workflow, after stage/commit/push."""
+        self._is_publishing = False
+        progress.close()
+        self._update_button_states_fast()
 
-        result = coordinator.commit_changes(self._current_repo_root, commit_message)
         if not result.ok:
-            progress.close()
             # Special handling for NOTHING_TO_COMMIT
             if (
                 result.step == publish.PublishStep.COMMIT
@@ -2785,18 +2811,6 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
                 self._handle_publish_error(result)
             return
 
-        # Step 5: Push
-        progress.setLabelText("Pushing to remote…")
-        progress.setValue(4)
-        QtWidgets.QApplication.processEvents()
-
-        result = coordinator.push_to_remote(self._current_repo_root)
-        progress.close()
-
-        if not result.ok:
-            self._handle_publish_error(result)
-            return
-
         # Success!
         self._show_status_message("Published successfully", is_error=False)
 
@@ -2812,8 +2826,6 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         self._on_commit_message_changed()
 
         # Update preview status
-        from datetime import datetime, timezone
-
         settings.save_last_preview_at(datetime.now(timezone.utc).isoformat())
         export_details = result.details or {}
         if export_details.get("rel_dir"):
@@ -2821,7 +2833,8 @@ class GitPDMDockWidget(QtWidgets.QDockWidget):
         self._update_preview_status_labels()
 
         # Refresh status views
-        self._refresh_status_views(self._current_repo_root)
+        if self._current_repo_root:
+            self._refresh_status_views(self._current_repo_root)
 
     def _handle_publish_error(self, result):
         """Display publish error to user."""
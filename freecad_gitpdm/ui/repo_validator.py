@@ -5,7 +5,6 @@ Repository Validation Handler Module
 Sprint 4: Extracted from panel.py to manage repository validation and setup operations.
 """
 
-import json
 import os
 
 # FreeCAD's own Qt compatibility shim -- re-exports whichever binding
@@ -13,7 +12,7 @@ import os
 # code doesn't need updating on the next Qt major-version bump.
 from PySide import QtCore, QtWidgets
 
-from freecad_gitpdm.core import log, session_lock, checkpoint
+from freecad_gitpdm.core import log, session_lock, checkpoint, provider_config
 
 
 class RepoValidationHandler:
@@ -156,14 +155,7 @@ class RepoValidationHandler:
             return
         self._legacy_lfs_notice_shown.add(repo_root)
 
-        config_path = os.path.join(repo_root, ".freecad-pdm", "config.json")
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, ValueError):
-            return
-
-        if isinstance(data, dict) and data.get("storageMode") == "lfs":
+        if provider_config.probe(repo_root).data.get("storageMode") == "lfs":
             QtWidgets.QMessageBox.information(
                 self._parent,
                 "Legacy LFS Storage Mode",
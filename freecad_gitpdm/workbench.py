@@ -3,7 +3,93 @@
 """
 GitPDM Workbench Module
 Sprint 0: Workbench implementation (imported by InitGui.py)
+
+InitGui.py is exec'd by FreeCAD rather than imported, so module-level state
+there isn't reliable (see the Icon comment in InitGui.py). The activation
+logic it runs on every workbench switch lives here instead, in a normally
+imported module where its dependencies can be bound once at module scope.
 """
 
-# This module can contain additional workbench-related utilities
-# For Sprint 0, the main workbench class is in InitGui.py
+from freecad_gitpdm.core.lazy import lazy_import
+
+# Bound once, imported on first use: switching to the workbench shouldn't
+# re-run three import statements just to schedule a timer.
+QtCore = lazy_import("PySide.QtCore")
+FreeCADGui = lazy_import("FreeCADGui")
+log = lazy_import("freecad_gitpdm.core.log")
+jobs = lazy_import("freecad_gitpdm.core.jobs")
+commands = lazy_import("freecad_gitpdm.commands")
+
+# Set while an open is queued, so rapid workbench toggling doesn't stack
+# up several open_panel_deferred() calls on the event loop.
+_pending_open = False
+
+
+def on_activated():
+    """Called from GitPDMWorkbench.Activated(): schedule the panel to open."""
+    global _pending_open
+    log.info("GitPDM workbench activated")
+
+    if _pending_open:
+        return
+
+    # Common round-trip (GitPDM -> Part -> GitPDM): the panel never went
+    # away, so there's nothing to schedule.
+    dock = commands._find_dock(FreeCADGui.getMainWindow())
+    if dock is not None and dock.isVisible():
+        return
+
+    _pending_open = True
+
+    # Zero-delay: runs on the next event-loop pass, once Qt has finished
+    # the workbench switch, instead of a fixed 100 ms wait every time.
+    QtCore.QTimer.singleShot(0, open_panel_deferred)
+
+
+def open_panel_deferred():
+    """Open panel from the event loop to keep the workbench switch responsive.
+
+    The first open of a session imports the whole panel module graph
+    (handlers, providers, exporter) before any widget can be built. That
+    part touches no widgets, so it runs on a worker thread first and the
+    GUI thread only does the actual widget construction afterwards.
+    """
+    try:
+        if commands._find_dock(FreeCADGui.getMainWindow()) is not None:
+            _finish_open()
+            return
+        jobs.get_job_runner().run_callable(
+            "prewarm_panel",
+            _prewarm_panel,
+            on_success=lambda _result: _finish_open(),
+            on_error=_open_failed,
+        )
+    except Exception as e:
+        _open_failed(e)
+
+
+def _prewarm_panel():
+    """Worker-thread half of the first open: the panel import only.
+
+    Service creation stays on the GUI thread; get_services() isn't locked.
+    """
+    from freecad_gitpdm.ui import panel  # noqa: F401
+
+
+def _finish_open():
+    global _pending_open
+    _pending_open = False
+    try:
+        # Left-docked, tabbed with Report view/Python console when
+        # present (same fallback shape as commands._find_or_create_dock,
+        # reused here so the two entry points never disagree on layout).
+        dock = commands._find_or_create_dock()
+        commands._show_dock(dock)
+    except Exception as e:
+        log.error(f"Failed to auto-open panel: {e}")
+
+
+def _open_failed(error):
+    global _pending_open
+    _pending_open = False
+    log.error(f"Failed to auto-open panel: {error}")
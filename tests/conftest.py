@@ -33,6 +33,27 @@ def mock_freecad():
         del sys.modules["FreeCADGui"]
 
 
+@pytest.fixture(autouse=True)
+def reset_git_probe_cache():
+    """GitClient caches its git executable/version probe process-wide;
+    clear it so one test's mocked subprocess result can't leak into the
+    next."""
+    client_module = sys.modules.get("freecad_gitpdm.git.client")
+    if client_module is not None:
+        client_module._reset_git_probe_cache()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_token_store():
+    """create_token_store() memoizes its store process-wide; clear it so a
+    test's patched platform/env picks the store it expects."""
+    factory_module = sys.modules.get("freecad_gitpdm.auth.token_store_factory")
+    if factory_module is not None:
+        factory_module._reset_token_store()
+    yield
+
+
 @pytest.fixture
 def mock_qt():
     """Mock Qt modules behind FreeCAD's own "PySide" compatibility shim
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for core.diagnostics's report formatting.
+"""
+
+from unittest.mock import patch
+
+from freecad_gitpdm.core import diagnostics
+from freecad_gitpdm.core.diagnostics import format_diagnostics
+
+
+class TestFormatDiagnostics:
+    def test_missing_fields_render_as_none(self):
+        report = format_diagnostics({"python_version": "3.11.7 (main)\nGCC"})
+        assert report.startswith("=== GitPDM Diagnostics ===\n\nPlatform:\n")
+        assert "  Version: 3.11.7 (main)\n" in report
+        assert "  System: None\n" in report
+        assert "  Last verified: Never\n" in report
+        assert "Last API error" not in report
+        assert report.endswith("  Misses: 0\n\n=== End Diagnostics ===")
+
+    def test_api_error_block_only_when_set(self):
+        report = format_diagnostics(
+            {"last_api_error_code": "RATE_LIMITED", "github_user_id": 0}
+        )
+        assert "  User ID: 0\n" in report
+        assert (
+            "  Last API error:\n    Code: RATE_LIMITED\n    Message: \nCache:\n"
+            in report
+        )
+
+
+class TestGetDiagnostics:
+    def test_git_probe_is_opt_in(self):
+        with patch("freecad_gitpdm.git.client.GitClient") as git_client:
+            git_client.return_value.git_version.return_value = "git version 2.44"
+            fast = diagnostics.get_diagnostics()
+            assert "git_version" not in fast
+            git_client.assert_not_called()
+
+            full = diagnostics.get_diagnostics(include_git=True)
+            assert full["git_available"] is True
+            assert full["git_version"] == "git version 2.44"
@@ -3,7 +3,9 @@
 Tests for git.client module - Git client operations
 """
 
+import io
 import os
+import subprocess
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
@@ -14,11 +16,26 @@ from freecad_gitpdm.git.client import (
     STATUS_MODIFIED,
     STATUS_ADDED,
     STATUS_UNTRACKED,
+    STATUS_CONFLICT,
+    STATUS_RENAMED,
+    STATUS_COPIED,
+    STATUS_DELETED,
+    STATUS_UNKNOWN,
     _headless_credential_args,
     _headless_credential_username,
+    _iter_nul_records,
 )
 
 
+@pytest.fixture
+def real_client():
+    """A GitClient backed by the real git executable."""
+    client = GitClient()
+    if not client.is_git_available():
+        pytest.skip("git executable not available on this machine")
+    return client
+
+
 class TestHeadlessCredentialUsername:
     """Headless container credential auth must match the active provider's
     username convention, not assume GitHub's unconditionally (found while
@@ -159,10 +176,17 @@ class TestFileStatus:
 class TestGitStatus:
     """Test git status parsing"""
 
-    @patch("subprocess.run")
-    def test_get_status_clean_repo(self, mock_run, temp_repo):
+    @staticmethod
+    def _popen(stdout, returncode=0):
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(stdout)
+        proc.wait.return_value = returncode
+        return proc
+
+    @patch("subprocess.Popen")
+    def test_get_status_clean_repo(self, mock_popen, temp_repo):
         """Test status on clean repository"""
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        mock_popen.return_value = self._popen(b"")
 
         client = GitClient()
         client._git_available = True
@@ -171,28 +195,78 @@ class TestGitStatus:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    @patch("subprocess.run")
-    def test_get_status_modified_files(self, mock_run, temp_repo):
+    @patch("subprocess.Popen")
+    def test_get_status_modified_files(self, mock_popen, temp_repo):
         """Test status with modified files"""
         # Porcelain v1 format with -z
-        mock_run.return_value = MagicMock(returncode=0, stdout=" M file.txt\0")
+        mock_popen.return_value = self._popen(b" M file.txt\0")
 
         client = GitClient()
         client._git_available = True
         result = client.status_porcelain(str(temp_repo))
 
-        assert isinstance(result, list)
+        assert [(e.path, e.kind) for e in result] == [("file.txt", STATUS_MODIFIED)]
 
-    @patch("subprocess.run")
-    def test_get_status_untracked_files(self, mock_run, temp_repo):
+    @patch("subprocess.Popen")
+    def test_get_status_untracked_files(self, mock_popen, temp_repo):
         """Test status with untracked files"""
-        mock_run.return_value = MagicMock(returncode=0, stdout="?? new_file.txt\0")
+        mock_popen.return_value = self._popen(b"?? new_file.txt\0")
 
         client = GitClient()
         client._git_available = True
         result = client.status_porcelain(str(temp_repo))
 
-        assert isinstance(result, list)
+        assert [e.is_untracked for e in result] == [True]
+
+    @patch("subprocess.Popen")
+    def test_rename_and_non_ascii_paths(self, mock_popen, temp_repo):
+        """-z output is UTF-8 bytes; renames list the new path first."""
+        mock_popen.return_value = self._popen(
+            "R  Bügel.FCStd\0Bracket.FCStd\0 M Teil ä.FCStd\0".encode()
+        )
+
+        client = GitClient()
+        client._git_available = True
+        result = client.status_porcelain(str(temp_repo))
+
+        assert [e.path for e in result] == [
+            "Bracket.FCStd -> Bügel.FCStd",
+            "Teil ä.FCStd",
+        ]
+
+    @patch("subprocess.Popen")
+    def test_failed_status_returns_nothing(self, mock_popen, temp_repo):
+        mock_popen.return_value = self._popen(b" M partial.txt\0", returncode=128)
+
+        client = GitClient()
+        client._git_available = True
+        assert client.status_porcelain(str(temp_repo)) == []
+
+    def test_status_kinds(self):
+        client = GitClient()
+        kinds = {
+            xy: client._classify_status_kind(xy[0], xy[1])
+            for xy in ("??", "UU", "AD", "R ", " C", " D", "A ", "MM", " T", "!!")
+        }
+        assert kinds == {
+            "??": STATUS_UNTRACKED,
+            "UU": STATUS_CONFLICT,
+            "AD": STATUS_CONFLICT,
+            "R ": STATUS_RENAMED,
+            " C": STATUS_COPIED,
+            " D": STATUS_DELETED,
+            "A ": STATUS_ADDED,
+            "MM": STATUS_MODIFIED,
+            " T": STATUS_MODIFIED,
+            "!!": STATUS_UNKNOWN,
+        }
+
+    def test_records_split_across_chunks(self):
+        stream = io.BytesIO("?? a.txt\0 M Bügel.FCStd\0".encode())
+        assert list(_iter_nul_records(stream, chunk_size=3)) == [
+            "?? a.txt",
+            " M Bügel.FCStd",
+        ]
 
 
 class TestGitCommit:
@@ -258,6 +332,17 @@ class TestCmdResult:
         assert result.ok is False
         assert result.error_code == "GIT_ERROR"
 
+    def test_guard_failures_are_fresh_results(self, tmp_path):
+        """Each guard failure is its own object, so callers may mutate it."""
+        client = GitClient()
+        client._git_available = True
+        missing = str(tmp_path / "missing")
+        first = client.stage_all(missing)
+        first.stderr = "changed"
+        second = client.commit(missing, "msg")
+        assert second is not first
+        assert second == CmdResult(False, "", "Invalid repository", "INVALID_REPO")
+
 
 class TestSubprocessKwargsRegression:
     """Regression tests for the broken `timeout=N ** _get_subprocess_kwargs()`
@@ -385,3 +470,311 @@ class TestShallowCloneTolerance:
 
         assert result.ok is False
         assert result.error_code == "deepen_failed"
+
+
+class TestGitProbeCache:
+    """The git executable/version probe is shared across GitClient
+    instances, since several callers construct their own."""
+
+    @patch("subprocess.run")
+    def test_second_instance_reuses_probe(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="git version 2.40.0")
+
+        assert GitClient().is_git_available() is True
+        calls_after_first = mock_run.call_count
+
+        second = GitClient()
+        assert second.is_git_available() is True
+        assert second.git_version() == "git version 2.40.0"
+        assert mock_run.call_count == calls_after_first
+
+    @patch("subprocess.run")
+    def test_failed_probe_is_not_cached(self, mock_run):
+        mock_run.side_effect = FileNotFoundError()
+        assert GitClient().is_git_available() is False
+
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(returncode=0, stdout="git version 2.40.0")
+        assert GitClient().is_git_available() is True
+
+
+class TestRepoQueryCaches:
+    """get_repo_root()/has_remote() are called on every panel refresh; the
+    answers are cached per client and invalidated by what could change them."""
+
+    def test_has_remote_cached_until_config_changes(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo).ok
+        assert real_client.has_remote(repo) is False
+
+        with patch("subprocess.run", side_effect=AssertionError("cached")):
+            assert real_client.has_remote(repo) is False
+
+        assert real_client.add_remote(repo, "origin", str(tmp_path / "r.git")).ok
+        assert real_client.has_remote(repo) is True
+
+    def test_repo_root_cached_while_repo_exists(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo).ok
+        root = real_client.get_repo_root(repo)
+        assert root is not None
+
+        with patch("subprocess.run", side_effect=AssertionError("cached")):
+            assert real_client.get_repo_root(repo) == root
+
+    def test_current_branch_cached_until_head_changes(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo).ok
+        subprocess.run(["git", "-C", repo, "checkout", "-q", "-b", "main"], check=True)
+        assert real_client.current_branch(repo) == "main"
+
+        with patch("subprocess.run", side_effect=AssertionError("cached")):
+            assert real_client.current_branch(repo) == "main"
+
+        subprocess.run(["git", "-C", repo, "checkout", "-q", "-b", "dev"], check=True)
+        assert real_client.current_branch(repo) == "dev"
+
+
+class TestStatusSummaryReuse:
+    @patch("subprocess.run")
+    def test_summary_from_existing_entries_runs_no_git(self, mock_run):
+        client = GitClient()
+        client._git_available = True
+        entries = [
+            FileStatus("a.FCStd", " ", "M", STATUS_MODIFIED, False, False),
+            FileStatus("b.FCStd", "?", "?", STATUS_UNTRACKED, False, True),
+        ]
+
+        summary = client.status_summary("/unused", entries)
+
+        mock_run.assert_not_called()
+        assert summary["is_clean"] is False
+        assert summary["modified"] == 1
+        assert summary["untracked"] == 1
+
+
+class TestAheadBehindWithUpstream:
+    def _commit(self, client, repo, name):
+        with open(os.path.join(repo, name), "w", encoding="utf-8") as f:
+            f.write(name)
+        assert client.stage_all(repo).ok
+        assert client.commit(repo, f"add {name}").ok
+
+    def test_counts_against_tracking_upstream(self, real_client, tmp_path):
+        remote = str(tmp_path / "remote.git")
+        real_client._run_command(
+            [real_client._get_git_command(), "init", "--bare", remote]
+        )
+        repo = str(tmp_path / "work")
+        os.mkdir(repo)
+        assert real_client.init_repo(repo).ok
+        real_client.set_config(repo, "user.name", "Test", local=True)
+        real_client.set_config(repo, "user.email", "t@example.invalid", local=True)
+        assert real_client.add_remote(repo, "origin", remote).ok
+        self._commit(real_client, repo, "a.txt")
+        assert real_client._run_command(
+            [real_client._get_git_command(), "-C", repo, "push", "-u", "origin", "HEAD"]
+        ).ok
+        self._commit(real_client, repo, "b.txt")
+
+        result = real_client.get_ahead_behind_with_upstream(repo)
+
+        assert result["ok"] is True
+        assert result["upstream"].startswith("origin/")
+        assert (result["ahead"], result["behind"]) == (1, 0)
+
+        # Push b, then move the local branch back one: 0 ahead, 1 behind.
+        git_cmd = real_client._get_git_command()
+        assert real_client._run_command([git_cmd, "-C", repo, "push", "-q"]).ok
+        assert real_client._run_command(
+            [git_cmd, "-C", repo, "reset", "-q", "--hard", "HEAD~1"]
+        ).ok
+        result = real_client.get_ahead_behind_with_upstream(repo)
+        assert result["ok"] is True
+        assert (result["ahead"], result["behind"]) == (0, 1)
+
+        # Remote-tracking ref deleted ("gone"): treated as no upstream.
+        upstream = result["upstream"]
+        assert real_client._run_command(
+            [git_cmd, "-C", repo, "update-ref", "-d", f"refs/remotes/{upstream}"]
+        ).ok
+        result = real_client.get_ahead_behind_with_upstream(repo)
+        assert result["upstream"] is None
+        assert result["ok"] is False
+
+    def test_no_upstream(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo).ok
+
+        result = real_client.get_ahead_behind_with_upstream(repo)
+
+        assert result["upstream"] is None
+        assert result["ok"] is False
+
+
+class TestErrorClassification:
+    """stderr -> error-code mapping, including tier priority and casing."""
+
+    @pytest.mark.parametrize(
+        "stderr, expected",
+        [
+            ("nothing to commit, working tree clean", "NOTHING_TO_COMMIT"),
+            ("Please tell me who you are.", "MISSING_IDENTITY"),
+            ("something else", "UNKNOWN_ERROR"),
+        ],
+    )
+    def test_commit_errors(self, stderr, expected):
+        assert GitClient()._classify_commit_error(stderr) == expected
+
+    @pytest.mark.parametrize(
+        "stderr, expected",
+        [
+            ("remote: Permission DENIED to user", "AUTH_OR_PERMISSION"),
+            ("fatal: The current branch has no upstream branch.", "NO_UPSTREAM"),
+            ("fatal: 'origin' does not appear to be a git repository", "NO_REMOTE"),
+            # Earlier tier wins even when a later tier's phrase comes first.
+            (
+                " ! [rejected] main -> main\nerror: authentication failed",
+                "AUTH_OR_PERMISSION",
+            ),
+            ("error: failed to push some refs", "REJECTED"),
+            ("", "UNKNOWN_ERROR"),
+        ],
+    )
+    def test_push_errors(self, stderr, expected):
+        assert GitClient()._classify_push_error(stderr) == expected
+
+    @pytest.mark.parametrize(
+        "stderr, expected",
+        [
+            ("fatal: working tree is dirty", "WORKING_TREE_DIRTY"),
+            ("Dirty index and\nworking tree", "WORKING_TREE_DIRTY"),
+            ("fatal: Not possible to fast-forward, aborting.", "DIVERGED_OR_NON_FF"),
+            ("CONFLICT (content): Merge conflict in a.FCStd", "DIVERGED_OR_NON_FF"),
+            ("fatal: could not read Username", "AUTH_OR_PERMISSION"),
+            ("fatal: not a git repository", "NO_REMOTE"),
+            ("dirty", "UNKNOWN_ERROR"),
+        ],
+    )
+    def test_pull_errors(self, stderr, expected):
+        assert GitClient()._classify_pull_error(stderr) == expected
+
+
+class TestIsDirCache:
+    """Repo-root isdir checks: positive results cached briefly, misses never."""
+
+    def test_positive_result_is_cached(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        with patch.object(client_mod.os.path, "isdir", return_value=True) as isdir:
+            assert client_mod._is_dir_cached(str(tmp_path))
+            assert client_mod._is_dir_cached(str(tmp_path))
+        assert isdir.call_count == 1
+
+    def test_missing_dir_is_rechecked(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        missing = str(tmp_path / "later")
+        assert not client_mod._is_dir_cached(missing)
+        os.mkdir(missing)
+        assert client_mod._is_dir_cached(missing)
+
+    def test_entry_expires_after_ttl(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        path = str(tmp_path)
+        assert client_mod._is_dir_cached(path)
+        client_mod._isdir_cache[path] -= client_mod._ISDIR_TTL + 1
+        with patch.object(client_mod.os.path, "isdir", return_value=False):
+            assert not client_mod._is_dir_cached(path)
+        assert path not in client_mod._isdir_cache
+
+
+class TestUntrackedCacheGate:
+    def test_default_until_the_filesystem_test_passes(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        client = GitClient()
+        client._git_exe = "git"
+        repo = str(tmp_path)
+        with patch.object(client_mod.threading, "Thread") as thread:
+            assert client._status_config(repo) == ()
+            assert client._status_config(repo) == ()
+        thread.return_value.start.assert_called_once()
+
+        client_mod._untracked_cache_ok[repo] = False
+        assert client._status_config(repo) == ()
+        client_mod._untracked_cache_ok[repo] = True
+        assert client._status_config(repo) == ("-c", "core.untrackedCache=true")
+
+    def test_filesystem_test_leaves_no_trace(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        client = GitClient()
+        if not client.is_git_available():
+            pytest.skip("git executable not available on this machine")
+        repo = str(tmp_path)
+        assert client.init_repo(repo).ok
+        before = sorted(os.listdir(tmp_path / ".git"))
+
+        # Passes on an ordinary local disk; the point here is where the
+        # scratch directories went.
+        assert client_mod._test_untracked_cache(client._get_git_command(), repo)
+
+        assert sorted(os.listdir(tmp_path / ".git")) == before
+        assert os.listdir(tmp_path) == [".git"]
+
+    def test_worktree_gitfile_is_not_tested(self, tmp_path):
+        from freecad_gitpdm.git import client as client_mod
+
+        (tmp_path / ".git").write_text("gitdir: elsewhere\n", encoding="utf-8")
+        with patch("subprocess.run", side_effect=AssertionError("ran git")):
+            assert not client_mod._test_untracked_cache("git", str(tmp_path))
+
+
+class TestInitialBranch:
+    def test_set_default_branch_skips_rename_when_already_on_it(
+        self, real_client, tmp_path
+    ):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo, initial_branch="trunk").ok
+        head = (tmp_path / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+        if head != "ref: refs/heads/trunk":
+            pytest.skip("git older than 2.28 ignores init.defaultBranch")
+
+        with patch("subprocess.run", side_effect=AssertionError("no rename")):
+            assert real_client.set_default_branch(repo, "trunk").ok
+
+    def test_set_default_branch_still_renames_other_branch(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo, initial_branch="trunk").ok
+        subprocess.run(
+            ["git", "-C", repo, "commit", "-q", "--allow-empty", "-m", "x"],
+            check=True,
+            env={
+                **os.environ,
+                "GIT_AUTHOR_NAME": "t",
+                "GIT_AUTHOR_EMAIL": "t@x",
+                "GIT_COMMITTER_NAME": "t",
+                "GIT_COMMITTER_EMAIL": "t@x",
+            },
+        )
+        assert real_client.set_default_branch(repo, "main").ok
+        assert real_client.current_branch(repo) == "main"
+
+
+class TestHasUncommittedChanges:
+    def test_clean_then_untracked(self, real_client, tmp_path):
+        repo = str(tmp_path)
+        assert real_client.init_repo(repo).ok
+        assert real_client.has_uncommitted_changes(repo) is False
+
+        (tmp_path / "part.FCStd").write_bytes(b"v1")
+        assert real_client.has_uncommitted_changes(repo) is True
+
+    @patch("subprocess.run")
+    def test_git_failure_reports_no_changes(self, mock_run, tmp_path):
+        mock_run.return_value = MagicMock(returncode=128, stdout=b"", stderr=b"")
+        client = GitClient()
+        client._git_available = True
+        assert client.has_uncommitted_changes(str(tmp_path)) is False
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for core.lazy.lazy_import: the proxy must not import anything until
+first attribute access, and must import exactly once after that.
+"""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+from freecad_gitpdm.core.lazy import lazy_import
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    """Register a throwaway module and count how often it's imported."""
+    calls = []
+    mod = types.ModuleType("gitpdm_lazy_fake")
+    mod.answer = 42
+
+    real_import = importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        if name == "gitpdm_lazy_fake":
+            calls.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setitem(sys.modules, "gitpdm_lazy_fake", mod)
+    monkeypatch.setattr(importlib, "import_module", counting_import)
+    return calls
+
+
+def test_no_import_until_attribute_access(fake_module):
+    proxy = lazy_import("gitpdm_lazy_fake")
+    assert fake_module == []
+    assert "not loaded" in repr(proxy)
+
+
+def test_imports_once_and_forwards_attributes(fake_module):
+    proxy = lazy_import("gitpdm_lazy_fake")
+    assert proxy.answer == 42
+    assert proxy.answer == 42
+    assert fake_module == ["gitpdm_lazy_fake"]
+    assert "answer" in dir(proxy)
+
+
+def test_missing_module_raises_on_first_use():
+    proxy = lazy_import("gitpdm_lazy_does_not_exist")
+    with pytest.raises(ImportError):
+        proxy.anything
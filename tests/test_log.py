@@ -49,6 +49,18 @@ class TestTokenRedaction:
         assert "ghp_token2" not in redacted
         assert redacted.count("[REDACTED_ACCESS_TOKEN]") == 2
 
+    def test_redact_access_token_and_pat_together(self):
+        """Test each token kind keeps its own placeholder in one message"""
+        message = "old ghp_token1, new github_pat_11ABC_def"
+        redacted = log._redact_sensitive(message)
+        assert redacted == "old [REDACTED_ACCESS_TOKEN], new [REDACTED_PAT]"
+
+    def test_redact_mixed_case_bearer_header(self):
+        """Test the case-insensitive patterns still run past the prefilter"""
+        message = "AUTHORIZATION: bearer abc.def"
+        redacted = log._redact_sensitive(message)
+        assert redacted == "AUTHORIZATION: bearer [REDACTED]"
+
     def test_no_redaction_for_safe_content(self):
         """Test that safe content is not modified"""
         message = "Normal log message without sensitive data"
@@ -90,6 +102,7 @@ class TestLoggingFunctions:
         log.warning("warning message")
         mock_redact.assert_called_once()
 
+    @patch("freecad_gitpdm.core.log._DEBUG_ENABLED", True)
     @patch("freecad_gitpdm.core.log._redact_sensitive")
     def test_debug_calls_redaction(self, mock_redact, mock_freecad):
         """Test that debug() calls redaction"""
@@ -97,6 +110,15 @@ class TestLoggingFunctions:
         log.debug("debug message")
         mock_redact.assert_called_once()
 
+    @patch("freecad_gitpdm.core.log._DEBUG_ENABLED", False)
+    @patch("freecad_gitpdm.core.log._redact_sensitive")
+    def test_debug_is_skipped_by_default(self, mock_redact, mock_freecad):
+        """Test that debug()/debug_safe() do nothing unless enabled"""
+        log.debug("debug message")
+        log.debug_safe("Debug", RuntimeError("ghp_debug"))
+        mock_redact.assert_not_called()
+        mock_freecad.Console.PrintLog.assert_not_called()
+
     def test_error_safe_with_exception(self, mock_freecad):
         """Test error_safe with exception object"""
         exc = Exception("Token: ghp_secret123")
@@ -115,6 +137,16 @@ class TestLoggingFunctions:
         log.debug_safe("Debug", exc)
         # Should not raise exception
 
+    def test_levels_route_to_console_methods(self, mock_freecad):
+        """Test each level goes to its FreeCAD console method"""
+        log.info("a")
+        log.warning("b")
+        log.error("c")
+        console = mock_freecad.Console
+        console.PrintLog.assert_called_once_with("[GitPDM] INFO: a\n")
+        console.PrintWarning.assert_called_once_with("[GitPDM] WARNING: b\n")
+        console.PrintError.assert_called_once_with("[GitPDM] ERROR: c\n")
+
     def test_logging_without_freecad(self):
         """Test logging falls back gracefully without FreeCAD"""
         # Temporarily remove FreeCAD from sys.modules
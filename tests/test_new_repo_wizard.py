@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for ui.new_repo_wizard's close handling while the push runs.
+
+PySide isn't available outside FreeCAD, so a minimal fake stands in for
+it: QWizard/QWizardPage are real (empty) classes the wizard can subclass,
+and everything else is a MagicMock.
+"""
+
+import importlib
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+_MODULE = "freecad_gitpdm.ui.new_repo_wizard"
+
+
+class _FakeWizard:
+    def __init__(self, *args, **kwargs):
+        self.rejected = False
+
+    def reject(self):
+        self.rejected = True
+
+
+@pytest.fixture
+def wizard_module(monkeypatch):
+    qt_widgets = MagicMock()
+    qt_widgets.QWizard = _FakeWizard
+    qt_widgets.QWizardPage = type("QWizardPage", (), {})
+    pyside = types.ModuleType("PySide")
+    pyside.QtCore = MagicMock()
+    pyside.QtGui = MagicMock()
+    pyside.QtWidgets = qt_widgets
+    monkeypatch.setitem(sys.modules, "PySide", pyside)
+    monkeypatch.delitem(sys.modules, _MODULE, raising=False)
+    yield importlib.import_module(_MODULE)
+    sys.modules.pop(_MODULE, None)
+
+
+def _bare_wizard(module, push_in_flight):
+    # Skip __init__: it builds every page, which needs real widgets.
+    wizard = module.NewRepoWizard.__new__(module.NewRepoWizard)
+    _FakeWizard.__init__(wizard)
+    wizard._push_in_flight = push_in_flight
+    return wizard
+
+
+class TestRejectDuringPush:
+    def test_close_is_ignored_while_push_runs(self, wizard_module):
+        wizard = _bare_wizard(wizard_module, push_in_flight=True)
+        wizard.reject()
+        assert wizard.rejected is False
+
+    def test_close_works_once_push_is_done(self, wizard_module):
+        wizard = _bare_wizard(wizard_module, push_in_flight=False)
+        wizard.reject()
+        assert wizard.rejected is True
@@ -12,6 +12,7 @@ subprocess can't actually prove.
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -108,6 +109,24 @@ class TestAnnounceOpen:
 
         assert other is None
 
+    def test_back_to_back_opens_share_one_fetch(
+        self, git_client, two_user_repos, monkeypatch
+    ):
+        repo_a, _ = two_user_repos
+        fetches = []
+        real_fetch = git_client.fetch_ref
+
+        def counting_fetch(repo_root, ref):
+            fetches.append(ref)
+            return real_fetch(repo_root, ref)
+
+        monkeypatch.setattr(git_client, "fetch_ref", counting_fetch)
+
+        presence.announce_open(git_client, repo_a, "Assembly.FCStd")
+        presence.announce_open(git_client, repo_a, "Part.FCStd")
+
+        assert fetches == [PRESENCE_REF]
+
 
 class TestHeartbeat:
     def test_heartbeat_refreshes_timestamp_without_changing_opened_at(
@@ -139,6 +158,21 @@ class TestHeartbeat:
         assert other is not None
         assert other.user == "Alice"
 
+    def test_heartbeat_files_is_one_commit(self, git_client, two_user_repos):
+        repo_a, _ = two_user_repos
+        presence.announce_open(git_client, repo_a, "A.FCStd")
+        presence.announce_open(git_client, repo_a, "B.FCStd")
+        before = git_client.rev_parse(repo_a, PRESENCE_REF)
+
+        presence.heartbeat_files(git_client, repo_a, ["A.FCStd", "B.FCStd"])
+
+        after = git_client.rev_parse(repo_a, PRESENCE_REF)
+        assert git_client.rev_parse(repo_a, f"{after}^") == before
+        content = git_client.read_file_at_ref(
+            repo_a, PRESENCE_REF, presence.PRESENCE_FILENAME
+        )
+        assert sorted(json.loads(content)) == ["A.FCStd", "B.FCStd"]
+
 
 class TestAnnounceClose:
     def test_close_removes_own_entry(self, git_client, two_user_repos):
@@ -175,6 +209,21 @@ class TestAnnounceClose:
 
         assert git_client.rev_parse(repo_a, PRESENCE_REF) is None
 
+    def test_close_files_removes_only_own_entries(self, git_client, two_user_repos):
+        repo_a, repo_b = two_user_repos
+        presence.announce_open(git_client, repo_a, "A.FCStd")
+        presence.announce_open(git_client, repo_b, "B.FCStd")
+        presence.announce_open(git_client, repo_b, "C.FCStd")
+
+        presence.announce_close_files(
+            git_client, repo_b, ["A.FCStd", "B.FCStd", "C.FCStd"]
+        )
+
+        content = git_client.read_file_at_ref(
+            repo_b, PRESENCE_REF, presence.PRESENCE_FILENAME
+        )
+        assert list(json.loads(content)) == ["A.FCStd"]
+
 
 class TestStaleness:
     def test_stale_entry_is_not_reported_as_someone_else(
@@ -209,6 +258,91 @@ class TestStaleness:
         assert other is None
 
 
+class TestOwnIdentityCache:
+    def test_repeat_lookups_skip_git_config(self, git_client, two_user_repos):
+        repo_a, _ = two_user_repos
+        first = presence._own_identity(git_client, repo_a)
+
+        class _NoConfig:
+            def get_config(self, *args, **kwargs):
+                raise AssertionError("identity should come from the cache")
+
+        assert presence._own_identity(_NoConfig(), repo_a) == first
+        assert first[0] == "Alice"
+
+    def test_config_change_invalidates(self, git_client, two_user_repos):
+        repo_a, _ = two_user_repos
+        presence._own_identity(git_client, repo_a)
+
+        git_client.set_config(repo_a, "user.name", "Alice Renamed", local=True)
+        # Bump mtime explicitly: filesystems with coarse timestamps could
+        # otherwise see the rewrite land in the same tick.
+        config_path = os.path.join(repo_a, ".git", "config")
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert presence._own_identity(git_client, repo_a)[0] == "Alice Renamed"
+
+    @staticmethod
+    def _fake_client(names):
+        class _Client:
+            def get_config(self, repo_root, key, local=False):
+                return names.get((key, local))
+
+        return _Client()
+
+    @pytest.fixture
+    def isolated_config(self, tmp_path, monkeypatch):
+        xdg = tmp_path / "xdg"
+        (xdg / "git").mkdir(parents=True)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(xdg))
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(tmp_path / "no-global"))
+        monkeypatch.setenv("GIT_CONFIG_SYSTEM", str(tmp_path / "no-system"))
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        return str(repo), xdg / "git" / "config"
+
+    def test_unknown_identity_is_not_cached(self, isolated_config):
+        repo, xdg_config = isolated_config
+        xdg_config.write_text("", encoding="utf-8")
+
+        assert presence._own_identity(self._fake_client({}), repo)[0] == "unknown"
+        named = self._fake_client({("user.name", False): "Carol"})
+        assert presence._own_identity(named, repo)[0] == "Carol"
+
+    def test_nothing_cached_without_any_config_file(self, isolated_config):
+        repo, _ = isolated_config
+        named = self._fake_client({("user.name", False): "Carol"})
+        presence._own_identity(named, repo)
+        assert repo not in presence._identity_cache
+
+    def test_xdg_config_change_invalidates(self, isolated_config):
+        repo, xdg_config = isolated_config
+        xdg_config.write_text("", encoding="utf-8")
+        presence._own_identity(self._fake_client({("user.name", False): "A"}), repo)
+
+        stat = os.stat(xdg_config)
+        os.utime(xdg_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        renamed = self._fake_client({("user.name", False): "B"})
+        assert presence._own_identity(renamed, repo)[0] == "B"
+
+    def test_cached_identity_expires(self, isolated_config):
+        repo, xdg_config = isolated_config
+        xdg_config.write_text("", encoding="utf-8")
+        presence._own_identity(self._fake_client({("user.name", False): "A"}), repo)
+
+        stamp, resolved_at, identity = presence._identity_cache[repo]
+        presence._identity_cache[repo] = (
+            stamp,
+            resolved_at - presence._IDENTITY_TTL_SECONDS - 1,
+            identity,
+        )
+
+        renamed = self._fake_client({("user.name", False): "B"})
+        assert presence._own_identity(renamed, repo)[0] == "B"
+
+
 class TestDescribeLastSeen:
     def test_moments_ago(self):
         now = datetime(2026, 7, 20, 12, 0, 0, tzinfo=timezone.utc)
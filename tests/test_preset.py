@@ -34,3 +34,24 @@ class TestPartGlossaryDefaults:
         )
         result = load_preset(tmp_path)
         assert result.preset["partGlossary"]["exclude"] == []
+
+
+class TestPresetFile:
+    def test_missing_file_is_not_an_error(self, tmp_path):
+        result = load_preset(tmp_path)
+        assert result.from_file is False
+        assert result.error is None
+
+    def test_directory_in_place_of_file_counts_as_missing(self, tmp_path):
+        (tmp_path / ".freecad-pdm" / "preset.json").mkdir(parents=True)
+        result = load_preset(tmp_path)
+        assert result.from_file is False
+        assert result.error is None
+
+    def test_malformed_file_reports_parse_failure(self, tmp_path):
+        preset_dir = tmp_path / ".freecad-pdm"
+        preset_dir.mkdir()
+        (preset_dir / "preset.json").write_text("{not json", encoding="utf-8")
+        result = load_preset(tmp_path)
+        assert result.from_file is True
+        assert result.error == "Preset parse failure; using defaults"
@@ -29,6 +29,15 @@ class TestDefaults:
         )
         assert provider_config.get_provider_id(str(tmp_path)) == "github"
 
+    def test_config_saved_with_bom_is_read(self, tmp_path):
+        """Editors like Notepad save UTF-8 with a BOM."""
+        config_dir = tmp_path / ".freecad-pdm"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text(
+            json.dumps({"provider": "generic"}), encoding="utf-8-sig"
+        )
+        assert provider_config.get_provider_id(str(tmp_path)) == "generic"
+
     def test_missing_config_no_remote_host(self, tmp_path):
         assert provider_config.get_remote_host(str(tmp_path)) is None
 
@@ -71,3 +80,84 @@ class TestSetProviderConfig:
     def test_creates_config_dir_if_missing(self, tmp_path):
         provider_config.set_provider_config(str(tmp_path), "gitlab")
         assert os.path.isdir(str(tmp_path / ".freecad-pdm"))
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        provider_config.set_provider_config(str(tmp_path), "gitlab")
+        provider_config.set_provider_config(str(tmp_path), "generic")
+        assert os.listdir(str(tmp_path / ".freecad-pdm")) == ["config.json"]
+
+    def test_unchanged_selection_is_not_rewritten(self, tmp_path, monkeypatch):
+        provider_config.set_provider_config(
+            str(tmp_path), "github", remote_host="github.example.com"
+        )
+        provider_config.probe(str(tmp_path))
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("config rewritten")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        provider_config.set_provider_config(
+            str(tmp_path), "GitHub", remote_host=" github.example.com "
+        )
+
+
+class TestProbe:
+    def test_missing_config(self, tmp_path):
+        result = provider_config.probe(str(tmp_path))
+        assert result.exists is False
+        assert result.data == {}
+        assert result.provider_id == "github"
+        assert result.remote_host is None
+
+    def test_one_read_answers_every_field(self, tmp_path):
+        config_dir = tmp_path / ".freecad-pdm"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text(
+            json.dumps(
+                {
+                    "provider": "GitLab",
+                    "remoteHost": " git.example.com ",
+                    "storageMode": "lfs",
+                }
+            ),
+            encoding="utf-8",
+        )
+        result = provider_config.probe(str(tmp_path))
+        assert result.exists is True
+        assert result.provider_id == "gitlab"
+        assert result.remote_host == "git.example.com"
+        assert result.data["storageMode"] == "lfs"
+
+    def test_malformed_config_exists_but_empty(self, tmp_path):
+        config_dir = tmp_path / ".freecad-pdm"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text("[1, 2", encoding="utf-8")
+        result = provider_config.probe(str(tmp_path))
+        assert result.exists is True
+        assert result.data == {}
+
+
+class TestProbeCache:
+    def test_unchanged_file_is_not_reread(self, tmp_path, monkeypatch):
+        provider_config.set_provider_config(str(tmp_path), "generic")
+        first = provider_config.probe(str(tmp_path))
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("config re-read")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        assert provider_config.probe(str(tmp_path)) is first
+
+    def test_hand_edit_is_picked_up(self, tmp_path):
+        provider_config.set_provider_config(str(tmp_path), "generic")
+        assert provider_config.get_provider_id(str(tmp_path)) == "generic"
+
+        config_file = tmp_path / ".freecad-pdm" / "config.json"
+        config_file.write_text(json.dumps({"provider": "gitlab"}), encoding="utf-8")
+        assert provider_config.get_provider_id(str(tmp_path)) == "gitlab"
+
+    def test_deleted_config_is_not_served_from_cache(self, tmp_path):
+        provider_config.set_provider_config(str(tmp_path), "generic")
+        provider_config.probe(str(tmp_path))
+        (tmp_path / ".freecad-pdm" / "config.json").unlink()
+        assert provider_config.probe(str(tmp_path)).exists is False
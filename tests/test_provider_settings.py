@@ -148,3 +148,42 @@ class TestGitHubBackwardCompat:
         settings.save_last_api_error("RATE_LIMITED", "slow down")
         param_group.SetString.assert_any_call("GitHubLastApiErrorCode", "RATE_LIMITED")
         param_group.SetString.assert_any_call("GitHubLastApiErrorMessage", "slow down")
+
+
+class TestProviderState:
+    def test_reads_every_field_from_one_param_group(self, mock_freecad):
+        param_group = mock_freecad.ParamGet.return_value
+        param_group.GetBool.return_value = True
+        strings = {
+            "GitHubLogin": "alice",
+            "GitHubHost": "github.example.com",
+            "GitHubUserId": "42",
+            "GitHubLastVerifiedAt": "2026-01-01T00:00:00Z",
+            "GitHubLastApiErrorCode": "RATE_LIMITED",
+            "GitHubLastApiErrorMessage": "slow down",
+        }
+        param_group.GetString.side_effect = lambda key, default: strings.get(
+            key, default
+        )
+
+        assert settings.load_github_state() == {
+            "connected": True,
+            "login": "alice",
+            "host": "github.example.com",
+            "user_id": 42,
+            "last_verified_at": "2026-01-01T00:00:00Z",
+            "last_api_error": ("RATE_LIMITED", "slow down"),
+        }
+        assert mock_freecad.ParamGet.call_count == 1
+
+    def test_unset_values_match_individual_loaders(self, mock_freecad):
+        param_group = mock_freecad.ParamGet.return_value
+        param_group.GetBool.side_effect = lambda key, default: default
+        param_group.GetString.side_effect = lambda key, default: default
+
+        state = settings.load_github_state()
+        assert state["connected"] is False
+        assert state["login"] is None
+        assert state["host"] == "github.com"
+        assert state["user_id"] is None
+        assert state["last_api_error"] == ("", "")
@@ -3,6 +3,10 @@
 Tests for the provider abstraction (Phase G4, R5.1-R5.3).
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 
 from freecad_gitpdm.providers import (
@@ -40,6 +44,28 @@ class TestRegistry:
             ["github", "generic", "gitlab", "gitea", "bitbucket", "sourcehut"]
         )
 
+    def test_lookup_imports_only_that_provider(self):
+        # Fresh interpreter: this module already imported every provider.
+        code = (
+            "import sys\n"
+            "from freecad_gitpdm.providers import get_provider_class\n"
+            "get_provider_class('gitlab')\n"
+            "for m in sorted(sys.modules):\n"
+            "    if m.startswith('freecad_gitpdm.providers.') and m.count('.') == 2:\n"
+            "        print(m)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert out.split() == [
+            "freecad_gitpdm.providers.base",
+            "freecad_gitpdm.providers.gitlab",
+        ]
+
     def test_default_provider_id_is_github(self):
         # Existing repos predate the provider field entirely; the default
         # must keep desktop behavior unchanged (see core/provider_config.py).
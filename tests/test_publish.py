@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for core/publish.py — the git half of the publish workflow.
+"""
+
+from unittest.mock import MagicMock
+
+from freecad_gitpdm.core import publish
+from freecad_gitpdm.git.client import CmdResult
+
+
+def _coordinator(commit_result=None, push_result=None):
+    git = MagicMock()
+    git.stage_all.return_value = CmdResult(True, "", "", None)
+    git.commit.return_value = commit_result or CmdResult(True, "", "", None)
+    git.push.return_value = push_result or CmdResult(True, "", "", None)
+    return publish.PublishCoordinator(git), git
+
+
+class TestStageCommitPush:
+    def test_runs_all_three_steps(self):
+        coordinator, git = _coordinator()
+        result = coordinator.stage_commit_push(
+            "/repo", None, MagicMock(), "  Update part  ", stage_all=True
+        )
+        assert result.ok
+        assert result.step == publish.PublishStep.PUSH
+        git.commit.assert_called_once_with("/repo", "Update part")
+        git.push.assert_called_once_with("/repo", "origin")
+
+    def test_stops_at_failed_commit(self):
+        coordinator, git = _coordinator(
+            commit_result=CmdResult(False, "", "nothing", "NOTHING_TO_COMMIT")
+        )
+        result = coordinator.stage_commit_push(
+            "/repo", None, MagicMock(), "msg", stage_all=True
+        )
+        assert not result.ok
+        assert result.step == publish.PublishStep.COMMIT
+        assert result.details == {"error_code": "NOTHING_TO_COMMIT"}
+        git.push.assert_not_called()
+
+    def test_empty_message_never_reaches_git(self):
+        coordinator, git = _coordinator()
+        result = coordinator.stage_commit_push(
+            "/repo", None, MagicMock(), "   ", stage_all=True
+        )
+        assert result.message == "Empty commit message"
+        git.commit.assert_not_called()
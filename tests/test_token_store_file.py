@@ -94,6 +94,21 @@ class TestGatingInvariant:
         store = token_store_factory.create_token_store()
         assert store is working
 
+    def test_factory_reuses_store(self, monkeypatch):
+        monkeypatch.delenv(ALLOW_FILE_TOKENS_ENV, raising=False)
+        created = []
+
+        def platform_store():
+            created.append(object())
+            return created[-1]
+
+        monkeypatch.setattr(
+            token_store_factory, "_create_platform_store", platform_store
+        )
+        first = token_store_factory.create_token_store()
+        assert token_store_factory.create_token_store() is first
+        assert len(created) == 1
+
     def test_factory_falls_back_when_platform_store_unusable(self, monkeypatch):
         monkeypatch.setenv(ALLOW_FILE_TOKENS_ENV, "1")
 
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for auth.token_store_macos's in-process token cache.
+
+A dict-backed fake stands in for the keyring module, so these run on
+any platform.
+"""
+
+import pytest
+
+from freecad_gitpdm.auth import token_store_macos
+from freecad_gitpdm.auth.oauth_device_flow import TokenResponse
+from freecad_gitpdm.auth.token_store_macos import MacOSKeychainStore
+
+
+class _FakeKeyring:
+    def __init__(self):
+        self.passwords = {}
+        self.reads = 0
+
+    def get_password(self, service, name):
+        self.reads += 1
+        return self.passwords.get((service, name))
+
+    def set_password(self, service, name, value):
+        self.passwords[(service, name)] = value
+
+    def delete_password(self, service, name):
+        self.passwords.pop((service, name), None)
+
+
+def _token(access):
+    return TokenResponse(
+        access_token=access,
+        token_type="bearer",
+        scope="repo",
+        obtained_at_utc="2026-07-16T12:00:00+00:00",
+    )
+
+
+@pytest.fixture
+def store():
+    token_store_macos._token_cache.clear()
+    token_store_macos._known_missing.clear()
+    store = MacOSKeychainStore.__new__(MacOSKeychainStore)
+    store._available = True
+    store._service_name = "freecad-gitpdm"
+    store._keyring = _FakeKeyring()
+    store._delete_error = KeyError
+    yield store
+    token_store_macos._token_cache.clear()
+    token_store_macos._known_missing.clear()
+
+
+class TestTokenCache:
+    def test_repeat_load_skips_keychain(self, store):
+        store.save("github.com", "alice", _token("t1"))
+        store._keyring.reads = 0
+
+        assert store.load("github.com", "alice").access_token == "t1"
+        assert store.load("github.com", "alice").access_token == "t1"
+        assert store._keyring.reads == 0
+
+    def test_cache_shared_across_instances(self, store):
+        store._keyring.set_password(
+            "freecad-gitpdm",
+            token_store_macos.credential_target_name("github.com", "alice"),
+            '{"access_token": "t1", "token_type": "bearer", "scope": "repo"}',
+        )
+        assert store.load("github.com", "alice").access_token == "t1"
+
+        other = MacOSKeychainStore.__new__(MacOSKeychainStore)
+        other._available = True
+        other._service_name = "freecad-gitpdm"
+        other._keyring = _FakeKeyring()  # empty: a hit must come from cache
+        assert other.load("github.com", "alice").access_token == "t1"
+
+    def test_host_only_save_invalidates_account_fallback(self, store):
+        store.save("github.com", None, _token("old"))
+        assert store.load("github.com", "alice").access_token == "old"
+
+        store.save("github.com", None, _token("new"))
+        assert store.load("github.com", "alice").access_token == "new"
+
+    def test_delete_invalidates(self, store):
+        store.save("github.com", "alice", _token("t1"))
+        store.delete("github.com", "alice")
+        assert store.load("github.com", "alice") is None
+
+    def test_load_racing_delete_does_not_outlive_it(self, store):
+        store.save("github.com", "alice", _token("t1"))
+        keyring = store._keyring
+        real_delete = keyring.delete_password
+
+        def delete_after_concurrent_load(service, name):
+            # A worker-thread load() landing after delete() dropped the
+            # cache but before the Keychain entry is gone re-caches it.
+            assert store.load("github.com", "alice").access_token == "t1"
+            keyring.delete_password = real_delete
+            real_delete(service, name)
+
+        keyring.delete_password = delete_after_concurrent_load
+        store.delete("github.com", "alice")
+
+        assert store.load("github.com", "alice") is None
+
+    def test_repeat_miss_skips_keychain(self, store):
+        assert store.load("github.com", "alice") is None
+        assert store._keyring.reads == 2  # account key, then host-only key
+
+        assert store.load("github.com", "alice") is None
+        assert store.load("github.com", None) is None
+        assert store._keyring.reads == 2
+
+    def test_save_clears_known_missing(self, store):
+        assert store.load("github.com", "alice") is None
+        store.save("github.com", None, _token("t2"))
+        assert store.load("github.com", "alice").access_token == "t2"
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for freecad_gitpdm.workbench: the activation path InitGui.py's
+GitPDMWorkbench.Activated() delegates to.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from freecad_gitpdm import workbench
+
+
+@pytest.fixture
+def wb(monkeypatch):
+    monkeypatch.setattr(workbench, "QtCore", MagicMock())
+    monkeypatch.setattr(workbench, "log", MagicMock())
+    monkeypatch.setattr(workbench, "FreeCADGui", MagicMock())
+    monkeypatch.setattr(workbench, "jobs", MagicMock())
+    commands = MagicMock()
+    commands._find_dock.return_value.isVisible.return_value = False
+    monkeypatch.setattr(workbench, "commands", commands)
+    monkeypatch.setattr(workbench, "_pending_open", False)
+    return workbench
+
+
+def test_activation_queues_open_on_next_event_loop_pass(wb):
+    wb.on_activated()
+    wb.QtCore.QTimer.singleShot.assert_called_once_with(0, wb.open_panel_deferred)
+
+
+def test_rapid_activation_queues_only_one_open(wb):
+    wb.on_activated()
+    wb.on_activated()
+    assert wb.QtCore.QTimer.singleShot.call_count == 1
+
+    wb.open_panel_deferred()
+    wb.on_activated()
+    assert wb.QtCore.QTimer.singleShot.call_count == 2
+
+
+def test_activation_skips_scheduling_when_dock_already_visible(wb):
+    wb.commands._find_dock.return_value.isVisible.return_value = True
+    wb.on_activated()
+    wb.QtCore.QTimer.singleShot.assert_not_called()
+    assert wb._pending_open is False
+
+
+def test_existing_dock_is_shown_without_prewarm(wb):
+    wb.on_activated()
+    wb.open_panel_deferred()
+
+    wb.jobs.get_job_runner.assert_not_called()
+    wb.commands._show_dock.assert_called_once()
+    assert wb._pending_open is False
+
+
+def test_first_open_prewarms_off_thread_then_builds_dock(wb):
+    wb.commands._find_dock.return_value = None
+    wb.on_activated()
+    wb.open_panel_deferred()
+
+    runner = wb.jobs.get_job_runner.return_value
+    runner.run_callable.assert_called_once()
+    wb.commands._find_or_create_dock.assert_not_called()
+    assert wb._pending_open is True
+
+    on_success = runner.run_callable.call_args.kwargs["on_success"]
+    on_success(None)
+    wb.commands._find_or_create_dock.assert_called_once()
+    assert wb._pending_open is False
+
+
+def test_open_failure_is_logged_not_raised(wb):
+    wb.commands._find_or_create_dock.side_effect = RuntimeError("boom")
+    wb.on_activated()
+    wb.open_panel_deferred()
+    wb.log.error.assert_called_once()
+    assert wb._pending_open is False
+
+
+def test_import_does_not_require_freecadgui(monkeypatch):
+    """Headless introspection (CI, scripts) must be able to import the
+    workbench helpers without FreeCADGui; it's only touched on first use."""
+    import importlib
+    import sys
+
+    monkeypatch.delitem(sys.modules, "FreeCADGui", raising=False)
+    monkeypatch.setitem(sys.modules, "FreeCADGui", None)  # import would fail
+
+    reloaded = importlib.reload(workbench)
+    assert "not loaded" in repr(reloaded.FreeCADGui)